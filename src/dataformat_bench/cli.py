@@ -23,7 +23,12 @@ from pathlib import Path
 
 import click
 
-from .config import DATA_DIR, DEFAULT_TARGET_SIZE_GB
+from .config import (
+    DATA_DIR,
+    DEFAULT_TARGET_SIZE_GB,
+    PARQUET_PAGE_SIZE,
+    PARQUET_ROW_GROUP_SIZE,
+)
 from .formats.avro import AvroHandler
 from .formats.parquet import ParquetHandler
 from .formats.protobuf import ProtobufHandler
@@ -75,6 +80,24 @@ def main():
     default=None,
     help="Random seed for reproducible data",
 )
+@click.option(
+    "--row-group-size",
+    type=int,
+    default=PARQUET_ROW_GROUP_SIZE,
+    help=f"Rows per Parquet row group (default: {PARQUET_ROW_GROUP_SIZE:,})",
+)
+@click.option(
+    "--page-size",
+    type=int,
+    default=PARQUET_PAGE_SIZE,
+    help=f"Parquet data page size in bytes (default: {PARQUET_PAGE_SIZE:,})",
+)
+@click.option(
+    "--parallel-generate",
+    is_flag=True,
+    default=False,
+    help="Generate data on a background thread, overlapping with writing",
+)
 @click.option(
     "--save-results",
     type=click.Path(path_type=Path),
@@ -86,6 +109,9 @@ def write(
     output: Path,
     formats: str,
     seed: int | None,
+    row_group_size: int,
+    page_size: int,
+    parallel_generate: bool,
     save_results: Path | None,
 ):
     """Generate and write data in streaming mode (memory efficient)."""
@@ -95,6 +121,9 @@ def write(
 
     # Parse formats
     format_names = [f.strip().lower() for f in formats.split(",")]
+    handler_options = {
+        "parquet": {"row_group_size": row_group_size, "page_size": page_size},
+    }
     handlers = []
 
     for format_name in format_names:
@@ -102,7 +131,7 @@ def write(
             click.echo(f"❌ Unknown format: {format_name}", err=True)
             click.echo(f"Available: {', '.join(FORMAT_MAP.keys())}", err=True)
             return
-        handlers.append(FORMAT_MAP[format_name]())
+        handlers.append(FORMAT_MAP[format_name](**handler_options.get(format_name, {})))
 
     # Calculate records needed
     generator = OrderGenerator(seed=seed)
@@ -117,7 +146,7 @@ def write(
         click.echo(f"  Seed: {seed}")
 
     # Run write benchmark
-    wb = WriteBenchmark(output_dir=output)
+    wb = WriteBenchmark(output_dir=output, parallel_generate=parallel_generate)
     results = wb.run_all_formats(handlers, total_records, seed)
 
     # Save results
@@ -164,6 +193,13 @@ def write(
     default=600,
     help="Timeout per operation in seconds (default: 600 = 10min)",
 )
+@click.option(
+    "--parallel-read",
+    is_flag=True,
+    default=False,
+    help="Read all formats at once in separate processes. Faster, but the "
+    "formats compete for CPU and disk, so timings are not comparable",
+)
 @click.option(
     "--save-results",
     type=click.Path(path_type=Path),
@@ -176,6 +212,7 @@ def read(
     runs: int,
     filter_category: str,
     timeout: int,
+    parallel_read: bool,
     save_results: Path | None,
 ):
     """Run read benchmark on existing files (memory efficient)."""
@@ -199,6 +236,8 @@ def read(
     click.echo(f"  Runs: {runs}")
     click.echo(f"  Filter category: {filter_category}")
     click.echo(f"  Timeout: {timeout}s ({timeout / 60:.1f} min)")
+    if parallel_read:
+        click.echo("  ⚠️  Parallel read: timings are not comparable across formats")
 
     # Run read benchmark
     rb = ReadBenchmark(
@@ -206,6 +245,7 @@ def read(
         runs=runs,
         filter_category=filter_category,
         timeout_seconds=timeout,
+        parallel_read=parallel_read,
     )
     results = rb.run_all_formats(handlers)
 
@@ -339,6 +379,31 @@ def report(
     default=600,
     help="Timeout per read operation in seconds (default: 600 = 10min)",
 )
+@click.option(
+    "--row-group-size",
+    type=int,
+    default=PARQUET_ROW_GROUP_SIZE,
+    help=f"Rows per Parquet row group (default: {PARQUET_ROW_GROUP_SIZE:,})",
+)
+@click.option(
+    "--page-size",
+    type=int,
+    default=PARQUET_PAGE_SIZE,
+    help=f"Parquet data page size in bytes (default: {PARQUET_PAGE_SIZE:,})",
+)
+@click.option(
+    "--parallel-generate",
+    is_flag=True,
+    default=False,
+    help="Generate data on a background thread, overlapping with writing",
+)
+@click.option(
+    "--parallel-read",
+    is_flag=True,
+    default=False,
+    help="Read all formats at once in separate processes. Faster, but the "
+    "formats compete for CPU and disk, so timings are not comparable",
+)
 @click.option(
     "--report-file",
     type=click.Path(path_type=Path),
@@ -352,6 +417,10 @@ def run(
     runs: int,
     seed: int | None,
     timeout: int,
+    row_group_size: int,
+    page_size: int,
+    parallel_generate: bool,
+    parallel_read: bool,
     report_file: Path | None,
 ):
     """Run full pipeline: write -> read -> report."""
@@ -361,13 +430,16 @@ def run(
 
     # Parse formats
     format_names = [f.strip().lower() for f in formats.split(",")]
+    handler_options = {
+        "parquet": {"row_group_size": row_group_size, "page_size": page_size},
+    }
     handlers = []
 
     for format_name in format_names:
         if format_name not in FORMAT_MAP:
             click.echo(f"❌ Unknown format: {format_name}", err=True)
             return
-        handlers.append(FORMAT_MAP[format_name]())
+        handlers.append(FORMAT_MAP[format_name](**handler_options.get(format_name, {})))
 
     generator = OrderGenerator(seed=seed)
     total_records = generator.estimate_records_for_size(size)
@@ -378,6 +450,8 @@ def run(
     click.echo(f"  Formats: {', '.join(format_names)}")
     click.echo(f"  Read runs: {runs}")
     click.echo(f"  Read timeout: {timeout}s ({timeout / 60:.1f} min)")
+    if parallel_read:
+        click.echo("  ⚠️  Parallel read: timings are not comparable across formats")
     if seed is not None:
         click.echo(f"  Seed: {seed}")
 
@@ -385,7 +459,7 @@ def run(
     click.echo(f"\n{'='*60}")
     click.echo("Phase 1: Write Benchmark")
     click.echo("="*60)
-    wb = WriteBenchmark(output_dir=output)
+    wb = WriteBenchmark(output_dir=output, parallel_generate=parallel_generate)
     write_results = wb.run_all_formats(handlers, total_records, seed)
     wb.save_results(write_results, output / "write_results.json")
 
@@ -393,7 +467,12 @@ def run(
     click.echo(f"\n{'='*60}")
     click.echo("Phase 2: Read Benchmark")
     click.echo("="*60)
-    rb = ReadBenchmark(input_dir=output, runs=runs, timeout_seconds=timeout)
+    rb = ReadBenchmark(
+        input_dir=output,
+        runs=runs,
+        timeout_seconds=timeout,
+        parallel_read=parallel_read,
+    )
     read_results = rb.run_all_formats(handlers)
     rb.save_results(read_results, output / "read_results.json")
 
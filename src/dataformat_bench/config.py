@@ -11,6 +11,17 @@ PROTO_DIR = PROJECT_ROOT / "proto"
 DEFAULT_TARGET_SIZE_GB = 10
 BATCH_SIZE = 100_000  # Number of records to generate at once
 BENCHMARK_RUNS = 3  # Number of times to repeat each measurement
+PREFETCH_BATCHES = 4  # Batches generated ahead of the writer in the background
+AVRO_SYNC_INTERVAL = 4 * 1024 * 1024  # Uncompressed bytes per Avro block
+READ_BUFFER_SIZE = 4 * 1024 * 1024  # File buffer for sequential scans
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024  # File buffer for sequential writes
+PARQUET_ROW_GROUP_SIZE = 1_000_000  # Rows per Parquet row group
+PARQUET_PAGE_SIZE = 1024 * 1024  # Target Parquet data page size in bytes
+# Rows buffered and sorted by category before writing, rounded down to whole
+# row groups; ~160MB of Arrow data, held twice while the sorted copy is built
+PARQUET_SORT_BUFFER_ROWS = 1_000_000
+PARQUET_SCAN_BATCH_SIZE = 1 << 20  # Max rows per batch in streaming scans
+DEADLINE_CHECK_INTERVAL = 100_000  # Records between timeout checks in read loops
 
 # Data generation configuration
 CATEGORIES = [
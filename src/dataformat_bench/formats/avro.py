@@ -1,19 +1,46 @@
 """Avro format handler implementation."""
 
-from collections import defaultdict
 from datetime import datetime
+from itertools import compress
+from operator import attrgetter
 from pathlib import Path
-from typing import Callable, Iterator
+from typing import Callable, Iterable, Iterator
 
-from fastavro import reader, writer
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from fastavro import block_reader, writer
+from fastavro.write import Writer
 
+from ..config import AVRO_SYNC_INTERVAL, READ_BUFFER_SIZE, SHIPPING_COUNTRIES
+from ..fsutil import advise_sequential, open_direct_write
 from ..schema import AVRO_SCHEMA, Order
-from .base import FormatHandler
+from .base import FormatHandler, check_deadline
+
+AVRO_FIELDS = tuple(field["name"] for field in AVRO_SCHEMA["fields"])
+# Values in AVRO_FIELDS order, with order_date already in epoch milliseconds
+_get_avro_values = attrgetter(
+    *("order_date_ms" if name == "order_date" else name for name in AVRO_FIELDS)
+)
+
+# Accumulator slots for aggregate(); known countries get fixed codes up front
+COUNTRY_CODES = {country: code for code, country in enumerate(SHIPPING_COUNTRIES)}
+COUNTRY_SLOTS = 64
 
 
 class AvroHandler(FormatHandler):
     """Handler for Apache Avro format."""
 
+    def __init__(self, codec: str = "zstandard", compression_level: int | None = 1):
+        """Initialize Avro handler.
+
+        Args:
+            codec: Avro block codec (e.g. "zstandard", "snappy", "null")
+            compression_level: Codec compression level, None for codec default
+        """
+        self.codec = codec
+        self.compression_level = compression_level
+
     @property
     def format_name(self) -> str:
         return "avro"
@@ -22,16 +49,40 @@ class AvroHandler(FormatHandler):
     def file_extension(self) -> str:
         return ".avro"
 
-    def _order_to_avro(self, order: Order) -> dict:
-        """Convert Order to Avro-compatible dictionary.
+    def _orders_to_avro(self, orders: Iterable[Order]) -> Iterator[dict]:
+        """Convert Orders to Avro-compatible dictionaries.
+
+        A single dictionary is updated in place and yielded for every order,
+        so each record must be serialized before the next one is requested.
+        fastavro's writers do exactly that.
 
         Args:
-            order: Order object
+            orders: Order objects
 
-        Returns:
+        Yields:
             Dictionary with Avro-compatible types
         """
-        return order.to_avro_dict()
+        record = {}
+        for order in orders:
+            record.update(zip(AVRO_FIELDS, _get_avro_values(order)))
+            yield record
+
+    def _batch_to_avro(self, batch: pa.RecordBatch) -> Iterator[dict]:
+        """Convert an Arrow record batch to Avro-compatible dictionaries.
+
+        Like _orders_to_avro(), a single dictionary is updated in place and
+        yielded for every row.
+
+        Args:
+            batch: Record batch with one column per Order field
+
+        Yields:
+            Dictionary with Avro-compatible types
+        """
+        record = {}
+        for values in zip(*self._batch_to_pylists(batch, AVRO_FIELDS)):
+            record.update(zip(AVRO_FIELDS, values))
+            yield record
 
     def _avro_to_order(self, record: dict) -> Order:
         """Convert Avro record to Order object.
@@ -64,21 +115,101 @@ class AvroHandler(FormatHandler):
             data: List of Order objects to write
             path: Path to output file
         """
-        records = [self._order_to_avro(order) for order in data]
+        with open(path, "wb") as f:
+            writer(
+                f,
+                AVRO_SCHEMA,
+                self._orders_to_avro(data),
+                codec=self.codec,
+                sync_interval=AVRO_SYNC_INTERVAL,
+                codec_compression_level=self.compression_level,
+            )
+
+    def prepare(self, data: list[Order]) -> list[dict]:
+        """Convert orders to Avro records once for repeated writes.
+
+        Args:
+            data: List of Order objects
+
+        Returns:
+            List of Avro-compatible dictionaries
+        """
+        return [order.to_avro_dict() for order in data]
+
+    def write_prepared(self, payload: list[dict], path: Path) -> None:
+        """Write records returned by prepare() to Avro file.
 
+        Args:
+            payload: List of Avro-compatible dictionaries
+            path: Path to output file
+        """
         with open(path, "wb") as f:
-            writer(f, AVRO_SCHEMA, records, codec="snappy")
+            writer(
+                f,
+                AVRO_SCHEMA,
+                payload,
+                codec=self.codec,
+                sync_interval=AVRO_SYNC_INTERVAL,
+                codec_compression_level=self.compression_level,
+            )
+
+    def _write_records(
+        self,
+        chunks: Iterator[tuple[Iterator[dict], int]],
+        path: Path,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> tuple[int, int]:
+        """Write a stream of Avro record chunks to one file.
+
+        Records are appended through a single fastavro Writer, which emits a
+        compressed block every AVRO_SYNC_INTERVAL bytes, so only the current
+        chunk and block are held in memory. On Linux the file is written with
+        O_DIRECT, so it does not pollute the page cache for the read phase.
+
+        Args:
+            chunks: Iterator yielding (records, number of records) pairs
+            path: Path to output file
+            progress_callback: Optional callback with records written count
+
+        Returns:
+            Tuple of (total number of records written, file size in bytes)
+        """
+        total_records = 0
+
+        with open_direct_write(path) as f:
+            avro_writer = Writer(
+                f,
+                AVRO_SCHEMA,
+                codec=self.codec,
+                sync_interval=AVRO_SYNC_INTERVAL,
+                compression_level=self.compression_level,
+            )
+
+            write = avro_writer.write
+
+            for records, count in chunks:
+                for record in records:
+                    write(record)
+                total_records += count
+
+                if progress_callback:
+                    progress_callback(total_records)
+
+            avro_writer.flush()
+            file_size = f.tell()
+
+        return total_records, file_size
 
     def write_streaming(
         self,
         data_stream: Iterator[list[Order]],
         path: Path,
         progress_callback: Callable[[int], None] | None = None,
-    ) -> int:
+    ) -> tuple[int, int]:
         """Write data to Avro file in streaming mode.
 
-        Note: fastavro's writer() writes all records at once, so we collect
-        batches in memory before writing. This is a limitation of the library.
+        Each batch is converted to Avro records and written as in
+        _write_records().
 
         Args:
             data_stream: Iterator yielding batches of Order objects
@@ -86,23 +217,32 @@ class AvroHandler(FormatHandler):
             progress_callback: Optional callback with records written count
 
         Returns:
-            Total number of records written
+            Tuple of (total number of records written, file size in bytes)
         """
-        all_records = []
-        total_records = 0
+        chunks = ((self._orders_to_avro(batch), len(batch)) for batch in data_stream)
+        return self._write_records(chunks, path, progress_callback)
 
-        for batch in data_stream:
-            batch_records = [self._order_to_avro(order) for order in batch]
-            all_records.extend(batch_records)
-            total_records += len(batch)
+    def write_streaming_batches(
+        self,
+        batches: Iterator[pa.RecordBatch],
+        path: Path,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> tuple[int, int]:
+        """Write Arrow record batches to Avro file in streaming mode.
 
-            if progress_callback:
-                progress_callback(total_records)
+        Records are built straight from the batch columns, without creating
+        Order objects, and written as in _write_records().
 
-        with open(path, "wb") as f:
-            writer(f, AVRO_SCHEMA, all_records, codec="snappy")
+        Args:
+            batches: Iterator yielding record batches with the Order columns
+            path: Path to output file
+            progress_callback: Optional callback with records written count
 
-        return total_records
+        Returns:
+            Tuple of (total number of records written, file size in bytes)
+        """
+        chunks = ((self._batch_to_avro(batch), batch.num_rows) for batch in batches)
+        return self._write_records(chunks, path, progress_callback)
 
     def read_full(self, path: Path) -> Iterator[Order]:
         """Read all records from Avro file (full scan).
@@ -113,15 +253,18 @@ class AvroHandler(FormatHandler):
         Yields:
             Order objects
         """
-        with open(path, "rb") as f:
-            avro_reader = reader(f)
-            for record in avro_reader:
-                yield self._avro_to_order(record)
+        with open(path, "rb", buffering=READ_BUFFER_SIZE) as f:
+            advise_sequential(f)
+            for block in block_reader(f):
+                for record in block:
+                    yield self._avro_to_order(record)
 
     def read_filtered(self, path: Path, category: str) -> Iterator[Order]:
         """Read records filtered by category.
 
         Note: Avro doesn't support predicate pushdown, so we filter in-memory.
+        The filter is evaluated per Avro block with a vectorized comparison, so
+        Order objects are only built for matching records.
 
         Args:
             path: Path to input file
@@ -130,28 +273,109 @@ class AvroHandler(FormatHandler):
         Yields:
             Order objects matching the filter
         """
-        with open(path, "rb") as f:
-            avro_reader = reader(f)
-            for record in avro_reader:
-                if record["category"] == category:
+        with open(path, "rb", buffering=READ_BUFFER_SIZE) as f:
+            advise_sequential(f)
+            for block in block_reader(f):
+                records = list(block)
+                categories = pa.array([r["category"] for r in records], pa.string())
+                mask = pc.equal(categories, category).to_pylist()
+                for record in compress(records, mask):
                     yield self._avro_to_order(record)
 
-    def aggregate(self, path: Path) -> dict[str, float]:
-        """Aggregate total_amount by shipping_country.
+    def count_full(self, path: Path, deadline: float | None = None) -> int:
+        """Count all records in Avro file without building Order objects.
+
+        Every record is still decoded; the deadline is checked once per block.
 
         Args:
             path: Path to input file
+            deadline: time.monotonic() value to stop at, None for no limit
 
         Returns:
-            Dictionary mapping country to total amount
+            Number of records in file
+        """
+        count = 0
+        with open(path, "rb", buffering=READ_BUFFER_SIZE) as f:
+            advise_sequential(f)
+            for block in block_reader(f):
+                check_deadline(deadline)
+                count += sum(1 for _ in block)
+        return count
+
+    def count_filtered(
+        self, path: Path, category: str, deadline: float | None = None
+    ) -> int:
+        """Count records matching category without building Order objects.
+
+        Args:
+            path: Path to input file
+            category: Category to filter by
+            deadline: time.monotonic() value to stop at, None for no limit
+
+        Returns:
+            Number of records matching the filter
         """
-        aggregates = defaultdict(float)
+        count = 0
+        with open(path, "rb", buffering=READ_BUFFER_SIZE) as f:
+            advise_sequential(f)
+            for block in block_reader(f):
+                check_deadline(deadline)
+                count += sum(1 for record in block if record["category"] == category)
+        return count
+
+    def aggregate(self, path: Path, deadline: float | None = None) -> dict[str, float]:
+        """Aggregate total_amount by shipping_country.
 
-        with open(path, "rb") as f:
-            avro_reader = reader(f)
-            for record in avro_reader:
-                country = record["shipping_country"]
-                amount = record["total_amount"]
-                aggregates[country] += amount
+        Countries are mapped to small integer codes (configured countries are
+        pre-assigned, unknown ones get the next free code) and each Avro block
+        is summed with numpy.bincount into a small per-country array, so the
+        per-record work is one dict lookup instead of a float update.
 
-        return dict(aggregates)
+        Args:
+            path: Path to input file
+            deadline: time.monotonic() value to stop at, None for no limit
+
+        Returns:
+            Dictionary mapping country to total amount
+        """
+        country_codes = dict(COUNTRY_CODES)
+        assign_code = country_codes.setdefault
+        totals = np.zeros(COUNTRY_SLOTS, dtype=np.float64)
+        counts = np.zeros(COUNTRY_SLOTS, dtype=np.int64)
+
+        with open(path, "rb", buffering=READ_BUFFER_SIZE) as f:
+            advise_sequential(f)
+            for block in block_reader(f):
+                check_deadline(deadline)
+                records = list(block)
+                codes = np.fromiter(
+                    (
+                        assign_code(r["shipping_country"], len(country_codes))
+                        for r in records
+                    ),
+                    dtype=np.intp,
+                    count=len(records),
+                )
+                amounts = np.fromiter(
+                    (r["total_amount"] for r in records),
+                    dtype=np.float64,
+                    count=len(records),
+                )
+                block_totals = np.bincount(codes, weights=amounts)
+                block_counts = np.bincount(codes)
+
+                if len(block_totals) > len(totals):
+                    totals = np.concatenate(
+                        [totals, np.zeros(len(block_totals), dtype=np.float64)]
+                    )
+                    counts = np.concatenate(
+                        [counts, np.zeros(len(block_counts), dtype=np.int64)]
+                    )
+                totals[: len(block_totals)] += block_totals
+                counts[: len(block_counts)] += block_counts
+
+        return {
+            country: float(totals[code])
+            for country, code in country_codes.items()
+            if counts[code]
+        }
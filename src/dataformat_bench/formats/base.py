@@ -1,12 +1,38 @@
 """Abstract base class for format handlers."""
 
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Callable, Iterator
+from typing import Any, Callable, Iterable, Iterator
 
+import pyarrow as pa
+
+from ..config import DEADLINE_CHECK_INTERVAL
 from ..schema import Order
 
 
+class TimeoutError(Exception):
+    """Raised when operation exceeds timeout."""
+
+    pass
+
+
+def check_deadline(deadline: float | None) -> None:
+    """Raise TimeoutError if the deadline has passed.
+
+    Read loops call this between batches (or every DEADLINE_CHECK_INTERVAL
+    records), so a timed-out operation stops on its own thread.
+
+    Args:
+        deadline: time.monotonic() value to stop at, None for no limit
+
+    Raises:
+        TimeoutError: If the deadline has passed
+    """
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutError("Operation timed out")
+
+
 class FormatHandler(ABC):
     """Abstract base class for data format handlers."""
 
@@ -29,13 +55,36 @@ class FormatHandler(ABC):
             path: Path to output file
         """
 
+    def prepare(self, data: list[Order]) -> Any:
+        """Convert data into the payload consumed by write_prepared().
+
+        Lets repeated writes of the same data pay the conversion cost once.
+        The default payload is the data itself.
+
+        Args:
+            data: List of Order objects
+
+        Returns:
+            Handler-specific write payload
+        """
+        return data
+
+    def write_prepared(self, payload: Any, path: Path) -> None:
+        """Write a payload returned by prepare().
+
+        Args:
+            payload: Result of prepare()
+            path: Path to output file
+        """
+        self.write(payload, path)
+
     @abstractmethod
     def write_streaming(
         self,
         data_stream: Iterator[list[Order]],
         path: Path,
         progress_callback: Callable[[int], None] | None = None,
-    ) -> int:
+    ) -> tuple[int, int]:
         """Write data in streaming mode (memory efficient).
 
         Args:
@@ -44,9 +93,56 @@ class FormatHandler(ABC):
             progress_callback: Optional callback called with number of records written
 
         Returns:
-            Total number of records written
+            Tuple of (total number of records written, file size in bytes),
+            with the size taken from the handler's own file position
+        """
+
+    @abstractmethod
+    def write_streaming_batches(
+        self,
+        batches: Iterator[pa.RecordBatch],
+        path: Path,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> tuple[int, int]:
+        """Write Arrow record batches in streaming mode.
+
+        This is the path used by the write benchmark: every format receives
+        the same columnar batches from the generator and converts them to
+        its own representation inside the timed region.
+
+        Args:
+            batches: Iterator yielding record batches with one column per
+                Order field (order_date as timestamp[ms])
+            path: Path to output file
+            progress_callback: Optional callback called with number of records written
+
+        Returns:
+            Tuple of (total number of records written, file size in bytes)
         """
 
+    @staticmethod
+    def _batch_to_pylists(batch: pa.RecordBatch, names: Iterable[str]) -> list[list]:
+        """Convert record batch columns to Python lists for row-wise encoding.
+
+        order_date is converted to epoch milliseconds the same way as
+        Order.order_date_ms, so both write paths store identical values.
+
+        Args:
+            batch: Record batch with one column per Order field
+            names: Columns to convert, in output order
+
+        Returns:
+            One list of values per requested column
+        """
+        columns = []
+        for name in names:
+            # Much faster than Array.to_pylist(), which goes through Arrow scalars
+            values = batch.column(name).to_numpy(zero_copy_only=False).tolist()
+            if name == "order_date":
+                values = [int(date.timestamp() * 1000) for date in values]
+            columns.append(values)
+        return columns
+
     @abstractmethod
     def read_full(self, path: Path) -> Iterator[Order]:
         """Read all records from file (full scan).
@@ -70,15 +166,72 @@ class FormatHandler(ABC):
             Order objects matching the filter
         """
 
+    def count_full(self, path: Path, deadline: float | None = None) -> int:
+        """Count all records in file (full scan without building Orders).
+
+        Handlers should override this when they can scan the file without
+        materializing Order objects.
+
+        Args:
+            path: Path to input file
+            deadline: time.monotonic() value to stop at, None for no limit
+
+        Returns:
+            Number of records in file
+
+        Raises:
+            TimeoutError: If the deadline passes during the scan
+        """
+        return self._count_with_deadline(self.read_full(path), deadline)
+
+    def count_filtered(
+        self, path: Path, category: str, deadline: float | None = None
+    ) -> int:
+        """Count records matching category (filtered scan without building Orders).
+
+        Args:
+            path: Path to input file
+            category: Category to filter by
+            deadline: time.monotonic() value to stop at, None for no limit
+
+        Returns:
+            Number of records matching the filter
+
+        Raises:
+            TimeoutError: If the deadline passes during the scan
+        """
+        return self._count_with_deadline(self.read_filtered(path, category), deadline)
+
+    @staticmethod
+    def _count_with_deadline(items: Iterable, deadline: float | None) -> int:
+        """Count items, checking the deadline every DEADLINE_CHECK_INTERVAL items.
+
+        Args:
+            items: Iterable to exhaust
+            deadline: time.monotonic() value to stop at, None for no limit
+
+        Returns:
+            Number of items
+        """
+        count = 0
+        for count, _ in enumerate(items, 1):
+            if not count % DEADLINE_CHECK_INTERVAL:
+                check_deadline(deadline)
+        return count
+
     @abstractmethod
-    def aggregate(self, path: Path) -> dict[str, float]:
+    def aggregate(self, path: Path, deadline: float | None = None) -> dict[str, float]:
         """Aggregate total_amount by shipping_country.
 
         Args:
             path: Path to input file
+            deadline: time.monotonic() value to stop at, None for no limit
 
         Returns:
             Dictionary mapping country to total amount
+
+        Raises:
+            TimeoutError: If the deadline passes during the scan
         """
 
     def get_file_path(self, base_path: Path) -> Path:
@@ -1,18 +1,76 @@
 """Parquet format handler implementation."""
 
+from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
 from typing import Callable, Iterator
 
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
+from ..config import (
+    PARQUET_PAGE_SIZE,
+    PARQUET_ROW_GROUP_SIZE,
+    PARQUET_SCAN_BATCH_SIZE,
+    PARQUET_SORT_BUFFER_ROWS,
+)
 from ..schema import Order
-from .base import FormatHandler
+from .base import FormatHandler, check_deadline
+
+# Column names and Arrow types, in Order field order
+ORDER_COLUMNS = (
+    ("order_id", pa.string()),
+    ("customer_id", pa.int64()),
+    ("product_id", pa.int64()),
+    ("product_name", pa.string()),
+    ("category", pa.string()),
+    ("quantity", pa.int64()),
+    ("price", pa.float64()),
+    ("total_amount", pa.float64()),
+    ("order_date", pa.timestamp("ms")),
+    ("shipping_country", pa.string()),
+    ("payment_method", pa.string()),
+    ("is_returned", pa.bool_()),
+)
+ORDER_COLUMN_NAMES = [name for name, _ in ORDER_COLUMNS]
+_get_order_values = attrgetter(*ORDER_COLUMN_NAMES)
 
 
 class ParquetHandler(FormatHandler):
     """Handler for Apache Parquet format."""
 
+    # Every table and the writer use this schema, so no types are inferred
+    ORDER_SCHEMA = pa.schema(ORDER_COLUMNS)
+
+    def __init__(
+        self,
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+        page_size: int = PARQUET_PAGE_SIZE,
+        sort_buffer_rows: int = PARQUET_SORT_BUFFER_ROWS,
+    ):
+        """Initialize Parquet handler.
+
+        Larger row groups mean fewer footer entries and bigger decode
+        batches for full scans and aggregation; smaller ones let filtered
+        reads skip more data. Row groups are only pruned when the sort
+        buffer spans several of them, so with the default sizes (one row
+        group per buffer) filtered reads scan every row group.
+
+        Args:
+            row_group_size: Maximum number of rows per row group
+            page_size: Target data page size in bytes
+            sort_buffer_rows: Rows buffered and sorted by category before
+                writing, rounded down to whole row groups (at least one)
+        """
+        self.row_group_size = row_group_size
+        self.page_size = page_size
+        # Whole row groups, so a flush never ends in a short row group; the
+        # buffer and its sorted copy bound the write phase's memory
+        self.sort_buffer_rows = max(
+            row_group_size, sort_buffer_rows // row_group_size * row_group_size
+        )
+
     @property
     def format_name(self) -> str:
         return "parquet"
@@ -30,21 +88,13 @@ class ParquetHandler(FormatHandler):
         Returns:
             PyArrow Table
         """
-        data = {
-            "order_id": [o.order_id for o in orders],
-            "customer_id": [o.customer_id for o in orders],
-            "product_id": [o.product_id for o in orders],
-            "product_name": [o.product_name for o in orders],
-            "category": [o.category for o in orders],
-            "quantity": [o.quantity for o in orders],
-            "price": [o.price for o in orders],
-            "total_amount": [o.total_amount for o in orders],
-            "order_date": [o.order_date for o in orders],
-            "shipping_country": [o.shipping_country for o in orders],
-            "payment_method": [o.payment_method for o in orders],
-            "is_returned": [o.is_returned for o in orders],
-        }
-        return pa.table(data)
+        # One pass over the orders, transposed into per-column tuples
+        columns = list(zip(*map(_get_order_values, orders)))
+        if not columns:
+            columns = [()] * len(ORDER_COLUMNS)
+        return pa.Table.from_pydict(
+            dict(zip(ORDER_COLUMN_NAMES, columns)), schema=self.ORDER_SCHEMA
+        )
 
     def _table_to_orders(self, table: pa.Table) -> Iterator[Order]:
         """Convert PyArrow table to Order objects.
@@ -55,48 +105,111 @@ class ParquetHandler(FormatHandler):
         Yields:
             Order objects
         """
+        # Columns are converted to Python lists one record batch at a time and
+        # zipped into rows; ORDER_COLUMNS follows Order's field order.
+        # timestamp[ms] converts straight to naive datetime, no pandas involved
+        table = table.select(ORDER_COLUMN_NAMES)
         for batch in table.to_batches():
-            df = batch.to_pandas()
-            for _, row in df.iterrows():
-                yield Order(
-                    order_id=row["order_id"],
-                    customer_id=row["customer_id"],
-                    product_id=row["product_id"],
-                    product_name=row["product_name"],
-                    category=row["category"],
-                    quantity=row["quantity"],
-                    price=row["price"],
-                    total_amount=row["total_amount"],
-                    order_date=row["order_date"].to_pydatetime(),
-                    shipping_country=row["shipping_country"],
-                    payment_method=row["payment_method"],
-                    is_returned=row["is_returned"],
-                )
+            columns = [column.to_pylist() for column in batch.columns]
+            for row in zip(*columns):
+                yield Order(*row)
 
     def write(self, data: list[Order], path: Path) -> None:
         """Write data to Parquet file.
 
+        Rows are sorted by category so each row group covers few categories
+        and filtered reads can skip row groups by their statistics.
+
         Args:
             data: List of Order objects to write
             path: Path to output file
         """
-        table = self._orders_to_table(data)
+        table = self._orders_to_table(data).sort_by("category")
         pq.write_table(
             table,
             path,
             compression="snappy",
-            row_group_size=100_000,
+            row_group_size=self.row_group_size,
+            data_page_size=self.page_size,
+            use_dictionary=True,
+            write_statistics=True,
         )
 
+    def _write_sorted(self, writer: pq.ParquetWriter, tables: list[pa.Table]) -> None:
+        """Write buffered tables as row groups sorted by category.
+
+        Args:
+            writer: Open Parquet writer
+            tables: Buffered tables to combine
+        """
+        table = pa.concat_tables(tables).sort_by("category")
+        writer.write_table(table, row_group_size=self.row_group_size)
+
+    def _write_tables(
+        self,
+        tables: Iterator[pa.Table],
+        path: Path,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> tuple[int, int]:
+        """Write a stream of tables to a Parquet file.
+
+        Uses ParquetWriter to append tables incrementally. Tables are
+        buffered up to sort_buffer_rows rows and sorted by category before
+        being written, so row group statistics allow filtered reads
+        to skip most row groups.
+
+        Args:
+            tables: Iterator yielding non-empty tables with ORDER_SCHEMA
+            path: Path to output file
+            progress_callback: Optional callback with records written count
+
+        Returns:
+            Tuple of (total number of records written, file size in bytes)
+        """
+        total_records = 0
+        buffered = []
+        buffered_rows = 0
+
+        # The writer does not close a sink it was given, so the final size
+        # can be read from the sink's position after the footer is written
+        with pa.OSFile(str(path), "wb") as sink:
+            with pq.ParquetWriter(
+                sink,
+                self.ORDER_SCHEMA,
+                compression="snappy",
+                data_page_size=self.page_size,
+                use_dictionary=True,
+                write_statistics=True,
+            ) as writer:
+                for table in tables:
+                    buffered.append(table)
+                    buffered_rows += table.num_rows
+                    if buffered_rows >= self.sort_buffer_rows:
+                        self._write_sorted(writer, buffered)
+                        buffered = []
+                        buffered_rows = 0
+
+                    total_records += table.num_rows
+
+                    if progress_callback:
+                        progress_callback(total_records)
+
+                if buffered:
+                    self._write_sorted(writer, buffered)
+
+            file_size = sink.tell()
+
+        return total_records, file_size
+
     def write_streaming(
         self,
         data_stream: Iterator[list[Order]],
         path: Path,
         progress_callback: Callable[[int], None] | None = None,
-    ) -> int:
+    ) -> tuple[int, int]:
         """Write data to Parquet file in streaming mode.
 
-        Uses ParquetWriter to append batches incrementally.
+        Each batch is converted to a table and written as in _write_tables().
 
         Args:
             data_stream: Iterator yielding batches of Order objects
@@ -104,37 +217,36 @@ class ParquetHandler(FormatHandler):
             progress_callback: Optional callback with records written count
 
         Returns:
-            Total number of records written
+            Tuple of (total number of records written, file size in bytes)
         """
-        writer = None
-        total_records = 0
+        tables = (self._orders_to_table(batch) for batch in data_stream if batch)
+        return self._write_tables(tables, path, progress_callback)
 
-        try:
-            for batch in data_stream:
-                if not batch:
-                    continue
-
-                table = self._orders_to_table(batch)
-
-                if writer is None:
-                    # Initialize writer with schema from first batch
-                    writer = pq.ParquetWriter(
-                        path,
-                        table.schema,
-                        compression="snappy",
-                        write_batch_size=100_000,
-                    )
+    def write_streaming_batches(
+        self,
+        batches: Iterator[pa.RecordBatch],
+        path: Path,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> tuple[int, int]:
+        """Write Arrow record batches to Parquet file in streaming mode.
 
-                writer.write_table(table)
-                total_records += len(batch)
+        Fast path for producers that already hold columnar data: batches go
+        to the writer without being materialized as Order objects.
 
-                if progress_callback:
-                    progress_callback(total_records)
-        finally:
-            if writer is not None:
-                writer.close()
+        Args:
+            batches: Iterator yielding record batches with the Order columns
+            path: Path to output file
+            progress_callback: Optional callback with records written count
 
-        return total_records
+        Returns:
+            Tuple of (total number of records written, file size in bytes)
+        """
+        tables = (
+            pa.Table.from_batches([batch]).cast(self.ORDER_SCHEMA)
+            for batch in batches
+            if batch.num_rows
+        )
+        return self._write_tables(tables, path, progress_callback)
 
     def read_full(self, path: Path) -> Iterator[Order]:
         """Read all records from Parquet file (full scan).
@@ -148,6 +260,26 @@ class ParquetHandler(FormatHandler):
         table = pq.read_table(path)
         yield from self._table_to_orders(table)
 
+    def count_full(self, path: Path, deadline: float | None = None) -> int:
+        """Count all records by decoding every column batch by batch.
+
+        All columns are decoded, so the measurement covers Parquet's
+        columnar I/O and decompression without per-row Python objects.
+
+        Args:
+            path: Path to input file
+            deadline: time.monotonic() value to stop at, None for no limit
+
+        Returns:
+            Number of records in file
+        """
+        count = 0
+        batches = pq.ParquetFile(path).iter_batches(batch_size=PARQUET_SCAN_BATCH_SIZE)
+        for batch in batches:
+            check_deadline(deadline)
+            count += batch.num_rows
+        return count
+
     def read_filtered(self, path: Path, category: str) -> Iterator[Order]:
         """Read records filtered by category using predicate pushdown.
 
@@ -158,29 +290,90 @@ class ParquetHandler(FormatHandler):
         Yields:
             Order objects matching the filter
         """
-        # Use Parquet's predicate pushdown for efficient filtering
-        table = pq.read_table(
-            path,
-            filters=[("category", "=", category)],
-        )
+        table = self._scan_filtered(path, category, ORDER_COLUMN_NAMES)
         yield from self._table_to_orders(table)
 
-    def aggregate(self, path: Path) -> dict[str, float]:
+    def count_filtered(
+        self, path: Path, category: str, deadline: float | None = None
+    ) -> int:
+        """Count records matching category, decoding only the category column.
+
+        Row groups whose statistics exclude the category are skipped.
+
+        Args:
+            path: Path to input file
+            category: Category to filter by
+            deadline: time.monotonic() value to stop at, None for no limit
+
+        Returns:
+            Number of records matching the filter
+        """
+        scanner = ds.dataset(path, format="parquet").scanner(
+            columns=["category"],
+            filter=ds.field("category") == category,
+            batch_size=PARQUET_SCAN_BATCH_SIZE,
+        )
+        count = 0
+        for batch in scanner.to_reader():
+            check_deadline(deadline)
+            count += batch.num_rows
+        return count
+
+    def _scan_filtered(
+        self, path: Path, category: str, columns: list[str]
+    ) -> pa.Table:
+        """Scan a projection of the file with the category predicate pushed down.
+
+        Row groups whose statistics exclude the category are skipped, and
+        only the requested columns are decoded.
+
+        Args:
+            path: Path to input file
+            category: Category to filter by
+            columns: Columns to return
+
+        Returns:
+            PyArrow Table with matching rows
+        """
+        dataset = ds.dataset(path, format="parquet")
+        return dataset.to_table(
+            columns=columns,
+            filter=ds.field("category") == category,
+        )
+
+    def aggregate(self, path: Path, deadline: float | None = None) -> dict[str, float]:
         """Aggregate total_amount by shipping_country using columnar operations.
 
+        The two columns are streamed through a dataset scanner and each
+        record batch is grouped with Arrow's hash aggregation, so memory
+        use is bounded by the batch size rather than the file size.
+
         Args:
             path: Path to input file
+            deadline: time.monotonic() value to stop at, None for no limit
 
         Returns:
             Dictionary mapping country to total amount
         """
+        aggregates = defaultdict(float)
+
         # Read only necessary columns for efficiency
-        table = pq.read_table(
-            path,
+        scanner = ds.dataset(path, format="parquet").scanner(
             columns=["shipping_country", "total_amount"],
+            batch_size=PARQUET_SCAN_BATCH_SIZE,
         )
 
-        # Convert to pandas for easy groupby
-        df = table.to_pandas()
-        result = df.groupby("shipping_country")["total_amount"].sum().to_dict()
-        return result
+        for batch in scanner.to_reader():
+            check_deadline(deadline)
+            # Arrow's hash aggregation works on the columns directly, no pandas
+            grouped = (
+                pa.Table.from_batches([batch])
+                .group_by("shipping_country")
+                .aggregate([("total_amount", "sum")])
+            )
+            countries = grouped.column("shipping_country").to_pylist()
+            totals = grouped.column("total_amount_sum").to_pylist()
+            for country, total in zip(countries, totals):
+                aggregates[country] += total
+
+        return dict(aggregates)
@@ -1,20 +1,44 @@
 """Protobuf format handler implementation."""
 
-import struct
+import mmap
+import os
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Iterator
 
+import numpy as np
+import pyarrow as pa
+from google.protobuf.internal.decoder import _DecodeVarint32
+from google.protobuf.internal.encoder import _VarintBytes
+
+from ..config import BATCH_SIZE, DEADLINE_CHECK_INTERVAL, WRITE_BUFFER_SIZE
 from ..order_pb2 import Order as ProtoOrder
 from ..schema import Order
-from .base import FormatHandler
+from .base import FormatHandler, check_deadline
+
+# Column order unpacked by _encode_record_batch()
+PROTO_FIELDS = (
+    "order_id",
+    "customer_id",
+    "product_id",
+    "product_name",
+    "category",
+    "quantity",
+    "price",
+    "total_amount",
+    "order_date",
+    "shipping_country",
+    "payment_method",
+    "is_returned",
+)
 
 
 class ProtobufHandler(FormatHandler):
     """Handler for Protocol Buffers format.
 
-    Uses length-prefixed messages for writing multiple records to a single file.
+    Uses varint length-delimited messages (the standard protobuf stream
+    framing, as in writeDelimitedTo) for multiple records in a single file.
     """
 
     @property
@@ -34,20 +58,22 @@ class ProtobufHandler(FormatHandler):
         Returns:
             ProtoOrder message
         """
-        proto_order = ProtoOrder()
-        proto_order.order_id = order.order_id
-        proto_order.customer_id = order.customer_id
-        proto_order.product_id = order.product_id
-        proto_order.product_name = order.product_name
-        proto_order.category = order.category
-        proto_order.quantity = order.quantity
-        proto_order.price = order.price
-        proto_order.total_amount = order.total_amount
-        proto_order.order_date = int(order.order_date.timestamp() * 1000)
-        proto_order.shipping_country = order.shipping_country
-        proto_order.payment_method = order.payment_method
-        proto_order.is_returned = order.is_returned
-        return proto_order
+        # Keyword construction sets all fields in one call into the C runtime
+        # instead of one attribute assignment per field
+        return ProtoOrder(
+            order_id=order.order_id,
+            customer_id=order.customer_id,
+            product_id=order.product_id,
+            product_name=order.product_name,
+            category=order.category,
+            quantity=order.quantity,
+            price=order.price,
+            total_amount=order.total_amount,
+            order_date=order.order_date_ms,
+            shipping_country=order.shipping_country,
+            payment_method=order.payment_method,
+            is_returned=order.is_returned,
+        )
 
     def _proto_to_order(self, proto_order: ProtoOrder) -> Order:
         """Convert Protobuf message to Order object.
@@ -73,34 +99,132 @@ class ProtobufHandler(FormatHandler):
             is_returned=proto_order.is_returned,
         )
 
+    def _encode_batch(self, orders: list[Order]) -> bytearray:
+        """Serialize orders into one buffer of length-delimited messages.
+
+        Args:
+            orders: Order objects to serialize
+
+        Returns:
+            Buffer with a varint length before each message
+        """
+        buffer = bytearray()
+        append = buffer.extend
+        to_proto = self._order_to_proto
+        varint = _VarintBytes
+
+        for order in orders:
+            serialized = to_proto(order).SerializeToString()
+            append(varint(len(serialized)))
+            append(serialized)
+
+        return buffer
+
+    def _encode_record_batch(self, batch: pa.RecordBatch) -> bytearray:
+        """Serialize an Arrow record batch into length-delimited messages.
+
+        Messages are built straight from the batch columns, without
+        creating Order objects.
+
+        Args:
+            batch: Record batch with one column per Order field
+
+        Returns:
+            Buffer with a varint length before each message
+        """
+        buffer = bytearray()
+        append = buffer.extend
+        varint = _VarintBytes
+
+        # Same explicit keyword construction as _order_to_proto()
+        for (
+            order_id,
+            customer_id,
+            product_id,
+            product_name,
+            category,
+            quantity,
+            price,
+            total_amount,
+            order_date,
+            shipping_country,
+            payment_method,
+            is_returned,
+        ) in zip(*self._batch_to_pylists(batch, PROTO_FIELDS)):
+            serialized = ProtoOrder(
+                order_id=order_id,
+                customer_id=customer_id,
+                product_id=product_id,
+                product_name=product_name,
+                category=category,
+                quantity=quantity,
+                price=price,
+                total_amount=total_amount,
+                order_date=order_date,
+                shipping_country=shipping_country,
+                payment_method=payment_method,
+                is_returned=is_returned,
+            ).SerializeToString()
+            append(varint(len(serialized)))
+            append(serialized)
+
+        return buffer
+
     def write(self, data: list[Order], path: Path) -> None:
-        """Write data to Protobuf file using length-prefixed messages.
+        """Write data to Protobuf file using length-delimited messages.
 
         Args:
             data: List of Order objects to write
             path: Path to output file
         """
-        with open(path, "wb") as f:
-            for order in data:
-                proto_order = self._order_to_proto(order)
-                serialized = proto_order.SerializeToString()
+        with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            for start in range(0, len(data), BATCH_SIZE):
+                f.write(self._encode_batch(data[start : start + BATCH_SIZE]))
+
+    def _write_buffers(
+        self,
+        chunks: Iterator[tuple[bytes, int]],
+        path: Path,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> tuple[int, int]:
+        """Write a stream of serialized message buffers to one file.
+
+        Protobuf naturally supports streaming with length-delimited messages.
+        Each chunk is a whole serialized batch and is written at once.
+
+        Args:
+            chunks: Iterator yielding (buffer, number of messages) pairs
+            path: Path to output file
+            progress_callback: Optional callback with records written count
+
+        Returns:
+            Tuple of (total number of records written, file size in bytes)
+        """
+        total_records = 0
+
+        with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            write = f.write
+            for buffer, count in chunks:
+                write(buffer)
+                total_records += count
+
+                if progress_callback:
+                    progress_callback(total_records)
 
-                # Write length prefix (4 bytes, big-endian)
-                length = len(serialized)
-                f.write(struct.pack(">I", length))
+            file_size = f.tell()
 
-                # Write serialized message
-                f.write(serialized)
+        return total_records, file_size
 
     def write_streaming(
         self,
         data_stream: Iterator[list[Order]],
         path: Path,
         progress_callback: Callable[[int], None] | None = None,
-    ) -> int:
+    ) -> tuple[int, int]:
         """Write data to Protobuf file in streaming mode.
 
-        Protobuf naturally supports streaming with length-prefixed messages.
+        Each batch is serialized into a single buffer and written as in
+        _write_buffers().
 
         Args:
             data_stream: Iterator yielding batches of Order objects
@@ -108,56 +232,117 @@ class ProtobufHandler(FormatHandler):
             progress_callback: Optional callback with records written count
 
         Returns:
-            Total number of records written
+            Tuple of (total number of records written, file size in bytes)
         """
-        total_records = 0
+        chunks = ((self._encode_batch(batch), len(batch)) for batch in data_stream)
+        return self._write_buffers(chunks, path, progress_callback)
 
-        with open(path, "wb") as f:
-            for batch in data_stream:
-                for order in batch:
-                    proto_order = self._order_to_proto(order)
-                    serialized = proto_order.SerializeToString()
+    def write_streaming_batches(
+        self,
+        batches: Iterator[pa.RecordBatch],
+        path: Path,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> tuple[int, int]:
+        """Write Arrow record batches to Protobuf file in streaming mode.
 
-                    # Write length prefix (4 bytes, big-endian)
-                    length = len(serialized)
-                    f.write(struct.pack(">I", length))
+        Each batch is serialized as in _encode_record_batch() and written as
+        in _write_buffers().
 
-                    # Write serialized message
-                    f.write(serialized)
+        Args:
+            batches: Iterator yielding record batches with the Order columns
+            path: Path to output file
+            progress_callback: Optional callback with records written count
 
-                total_records += len(batch)
+        Returns:
+            Tuple of (total number of records written, file size in bytes)
+        """
+        chunks = (
+            (self._encode_record_batch(batch), batch.num_rows) for batch in batches
+        )
+        return self._write_buffers(chunks, path, progress_callback)
 
-                if progress_callback:
-                    progress_callback(total_records)
+    def _iter_frames(
+        self, path: Path, deadline: float | None = None
+    ) -> Iterator[memoryview]:
+        """Iterate over the serialized messages of a varint-delimited file.
 
-        return total_records
+        The file is memory-mapped and frames are yielded as zero-copy slices
+        of the mapping, so there are no per-message read() calls or copies.
+        A truncated final message is ignored. The deadline is checked every
+        DEADLINE_CHECK_INTERVAL frames.
 
-    def _read_messages(self, path: Path) -> Iterator[ProtoOrder]:
-        """Read length-prefixed Protobuf messages from file.
+        Args:
+            path: Path to input file
+            deadline: time.monotonic() value to stop at, None for no limit
+
+        Yields:
+            Serialized message bytes
+        """
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+            # Not closed explicitly: yielded frames keep the mapping alive and
+            # it is unmapped once the last one is released
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+        view = memoryview(mapped)
+        decode = _DecodeVarint32
+        pos = 0
+        until_check = DEADLINE_CHECK_INTERVAL
+
+        while pos < size:
+            try:
+                length, start = decode(mapped, pos)
+            except IndexError:
+                # Truncated length prefix at end of file
+                break
+
+            end = start + length
+            if end > size:
+                break
+
+            yield view[start:end]
+            pos = end
+
+            until_check -= 1
+            if not until_check:
+                check_deadline(deadline)
+                until_check = DEADLINE_CHECK_INTERVAL
+
+    def _read_messages(
+        self, path: Path, deadline: float | None = None
+    ) -> Iterator[ProtoOrder]:
+        """Read length-delimited Protobuf messages from file.
 
         Args:
             path: Path to input file
+            deadline: time.monotonic() value to stop at, None for no limit
 
         Yields:
             ProtoOrder messages
         """
-        with open(path, "rb") as f:
-            while True:
-                # Read length prefix
-                length_bytes = f.read(4)
-                if not length_bytes:
-                    break
+        parse = ProtoOrder.FromString
+        for frame in self._iter_frames(path, deadline):
+            yield parse(frame)
+
+    def count_full(self, path: Path, deadline: float | None = None) -> int:
+        """Count all messages by walking the length prefixes.
 
-                length = struct.unpack(">I", length_bytes)[0]
+        Message payloads are skipped instead of being parsed. A truncated
+        final message is not counted, matching _read_messages().
 
-                # Read message
-                message_bytes = f.read(length)
-                if len(message_bytes) != length:
-                    break
+        Args:
+            path: Path to input file
+            deadline: time.monotonic() value to stop at, None for no limit
 
-                proto_order = ProtoOrder()
-                proto_order.ParseFromString(message_bytes)
-                yield proto_order
+        Returns:
+            Number of records in file
+        """
+        return sum(1 for _ in self._iter_frames(path, deadline))
 
     def read_full(self, path: Path) -> Iterator[Order]:
         """Read all records from Protobuf file (full scan).
@@ -168,13 +353,32 @@ class ProtobufHandler(FormatHandler):
         Yields:
             Order objects
         """
+        to_order = self._proto_to_order
         for proto_order in self._read_messages(path):
-            yield self._proto_to_order(proto_order)
+            yield to_order(proto_order)
+
+    def _iter_matching_messages(
+        self, path: Path, category: str, deadline: float | None = None
+    ) -> Iterator[ProtoOrder]:
+        """Iterate over messages whose category matches.
+
+        Args:
+            path: Path to input file
+            category: Category to filter by
+            deadline: time.monotonic() value to stop at, None for no limit
+
+        Yields:
+            Matching ProtoOrder messages
+        """
+        for message in self._read_messages(path, deadline):
+            if message.category == category:
+                yield message
 
     def read_filtered(self, path: Path, category: str) -> Iterator[Order]:
         """Read records filtered by category.
 
         Note: Protobuf doesn't support predicate pushdown, so we filter in-memory.
+        Order objects are only built for matching messages.
 
         Args:
             path: Path to input file
@@ -183,24 +387,78 @@ class ProtobufHandler(FormatHandler):
         Yields:
             Order objects matching the filter
         """
-        for proto_order in self._read_messages(path):
-            if proto_order.category == category:
-                yield self._proto_to_order(proto_order)
+        to_order = self._proto_to_order
+        for message in self._iter_matching_messages(path, category):
+            yield to_order(message)
+
+    def count_filtered(
+        self, path: Path, category: str, deadline: float | None = None
+    ) -> int:
+        """Count records matching the category without building Order objects.
+
+        Args:
+            path: Path to input file
+            category: Category to filter by
+            deadline: time.monotonic() value to stop at, None for no limit
+
+        Returns:
+            Number of matching records
+        """
+        matching = self._iter_matching_messages(path, category, deadline)
+        return sum(1 for _ in matching)
 
-    def aggregate(self, path: Path) -> dict[str, float]:
+    def aggregate(self, path: Path, deadline: float | None = None) -> dict[str, float]:
         """Aggregate total_amount by shipping_country.
 
+        The two aggregated fields of each message are collected into plain
+        lists and summed per batch of BATCH_SIZE records with a vectorized
+        group-by, so the per-record Python work is a parse and two list
+        appends.
+
         Args:
             path: Path to input file
+            deadline: time.monotonic() value to stop at, None for no limit
 
         Returns:
             Dictionary mapping country to total amount
         """
         aggregates = defaultdict(float)
+        countries: list[str] = []
+        amounts: list[float] = []
+        add_country = countries.append
+        add_amount = amounts.append
 
-        for proto_order in self._read_messages(path):
-            country = proto_order.shipping_country
-            amount = proto_order.total_amount
-            aggregates[country] += amount
+        def merge() -> None:
+            for country, amount in _sum_batch(countries, amounts).items():
+                aggregates[country] += amount
+            countries.clear()
+            amounts.clear()
+
+        for message in self._read_messages(path, deadline):
+            add_country(message.shipping_country)
+            add_amount(message.total_amount)
+
+            if len(countries) >= BATCH_SIZE:
+                merge()
+
+        if countries:
+            merge()
 
         return dict(aggregates)
+
+
+def _sum_batch(countries: list[str], amounts: list[float]) -> dict[str, float]:
+    """Sum amounts by country for one batch of records.
+
+    Args:
+        countries: shipping_country of each record
+        amounts: total_amount of each record
+
+    Returns:
+        Dictionary mapping country to total amount within the batch
+    """
+    # Fixed-width strings keep the grouping in NumPy's C code, without pandas
+    uniques, codes = np.unique(np.array(countries), return_inverse=True)
+    weights = np.fromiter(amounts, dtype=np.float64, count=len(amounts))
+    sums = np.bincount(codes, weights=weights, minlength=len(uniques))
+    return dict(zip(uniques.tolist(), sums.tolist()))
@@ -0,0 +1,174 @@
+"""Filesystem helpers for cold-cache read measurements."""
+
+import io
+import mmap
+import os
+from pathlib import Path
+from typing import BinaryIO
+
+# Only needed to clear O_DIRECT, which exists on Linux only
+if hasattr(os, "O_DIRECT"):
+    import fcntl
+
+# O_DIRECT transfers must be aligned to the device's logical block size;
+# page alignment satisfies every common block device
+DIRECT_IO_CHUNK_SIZE = 4 * 1024 * 1024
+# Filled chunks submitted together in a single write() call
+DIRECT_IO_QUEUE_DEPTH = 8
+
+
+def drop_file_cache(path: Path) -> None:
+    """Evict a file's pages from the OS page cache (best effort).
+
+    Dirty pages are flushed with sync() first, since posix_fadvise() cannot
+    drop pages that are not yet written back. Platforms without
+    posix_fadvise() (macOS, Windows) only get the sync.
+
+    Args:
+        path: Path to file to evict
+    """
+    try:
+        os.sync()
+    except (AttributeError, OSError):
+        pass
+
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def advise_sequential(f: BinaryIO) -> None:
+    """Tell the kernel an open file will be read sequentially (best effort).
+
+    Args:
+        f: Open binary file
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+class DirectFileWriter(io.RawIOBase):
+    """Write-only file that bypasses the page cache with O_DIRECT.
+
+    Data is staged in a page-aligned buffer of DIRECT_IO_QUEUE_DEPTH chunks
+    of DIRECT_IO_CHUNK_SIZE bytes; once every chunk is filled the whole
+    queue is submitted with a single write() call. O_DIRECT cannot write the
+    final partial chunk, so it is cleared for the tail, which is then
+    written, synced and evicted on close. The file never lingers in the
+    page cache, so a following read benchmark starts cold.
+    """
+
+    def __init__(self, fd: int):
+        """Wrap a file descriptor opened with O_DIRECT.
+
+        Args:
+            fd: File descriptor opened for writing with O_DIRECT
+        """
+        super().__init__()
+        self._fd = fd
+        self._capacity = DIRECT_IO_CHUNK_SIZE * DIRECT_IO_QUEUE_DEPTH
+        self._buffer = mmap.mmap(-1, self._capacity)
+        self._view = memoryview(self._buffer)
+        self._used = 0
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        """Return the number of bytes written so far, staged ones included."""
+        return self._position
+
+    def write(self, data) -> int:
+        """Stage data and submit the chunk queue whenever it is full.
+
+        Args:
+            data: Bytes-like object
+
+        Returns:
+            Number of bytes accepted
+        """
+        source = memoryview(data).cast("B")
+        size = len(source)
+        offset = 0
+
+        while offset < size:
+            n = min(size - offset, self._capacity - self._used)
+            self._view[self._used : self._used + n] = source[offset : offset + n]
+            self._used += n
+            offset += n
+
+            if self._used == self._capacity:
+                self._write_all(self._view)
+                self._used = 0
+
+        self._position += size
+        return size
+
+    def _write_all(self, view: memoryview) -> None:
+        written = 0
+        while written < len(view):
+            written += os.write(self._fd, view[written:])
+
+    def close(self) -> None:
+        """Write queued chunks and the unaligned tail, then close the file."""
+        if self.closed:
+            return
+
+        try:
+            aligned = self._used - self._used % DIRECT_IO_CHUNK_SIZE
+            if aligned:
+                self._write_all(self._view[:aligned])
+
+            if self._used > aligned:
+                flags = fcntl.fcntl(self._fd, fcntl.F_GETFL)
+                fcntl.fcntl(self._fd, fcntl.F_SETFL, flags & ~os.O_DIRECT)
+                self._write_all(self._view[aligned : self._used])
+                os.fsync(self._fd)
+                os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            self._view.release()
+            self._buffer.close()
+            os.close(self._fd)
+            super().close()
+
+
+def open_direct_write(path: Path) -> BinaryIO:
+    """Open a file for a large sequential write, bypassing the page cache.
+
+    Falls back to a regular buffered file where O_DIRECT is unavailable
+    (non-Linux platforms) or rejected by the filesystem (e.g. tmpfs).
+
+    Args:
+        path: Path to output file
+
+    Returns:
+        Writable binary file object
+    """
+    if hasattr(os, "O_DIRECT"):
+        try:
+            fd = os.open(
+                path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644
+            )
+        except OSError:
+            pass
+        else:
+            return DirectFileWriter(fd)
+
+    return open(path, "wb")
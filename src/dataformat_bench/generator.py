@@ -1,15 +1,23 @@
 """Data generator for e-commerce orders."""
 
 import random
+import secrets
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Iterator
+from typing import Any, Iterator
 
+import numpy as np
+import pyarrow as pa
 from faker import Faker
 
 from .config import BATCH_SIZE, CATEGORIES, PAYMENT_METHODS, SHIPPING_COUNTRIES
 from .schema import Order
 
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+# Offsets of the 32 hex digits within a 36-character UUID string
+_UUID_HEX_OFFSETS = np.array([i for i in range(36) if i not in (8, 13, 18, 23)])
+
 
 class OrderGenerator:
     """Generator for realistic e-commerce order data."""
@@ -25,6 +33,7 @@ class OrderGenerator:
             random.seed(seed)
             Faker.seed(seed)
         self.faker = Faker()
+        self.rng = np.random.default_rng(seed)
 
     def generate_single(self) -> Order:
         """Generate a single order record.
@@ -55,6 +64,44 @@ class OrderGenerator:
             is_returned=random.random() < 0.05,  # 5% return rate
         )
 
+    def _generate_columns(self, size: int) -> dict[str, Any]:
+        """Generate a batch of order data column by column.
+
+        Numeric, categorical and id columns are drawn as whole NumPy arrays;
+        only product names are produced per record.
+
+        Args:
+            size: Number of orders to generate
+
+        Returns:
+            Dictionary mapping Order field name (in field order) to a NumPy
+            array or list of values
+        """
+        rng = self.rng
+        catch_phrase = self.faker.catch_phrase
+
+        quantity = rng.integers(1, 11, size)
+        price = np.round(rng.uniform(5.0, 500.0, size), 2)
+
+        # Random date within the last 2 years
+        now = np.datetime64(datetime.now(), "ms")
+        days_ago = rng.integers(0, 731, size).astype("timedelta64[D]")
+
+        return {
+            "order_id": _random_uuid4_strings(rng, size),
+            "customer_id": rng.integers(1, 1_000_001, size),
+            "product_id": rng.integers(1, 100_001, size),
+            "product_name": [catch_phrase() for _ in range(size)],
+            "category": rng.choice(CATEGORIES, size),
+            "quantity": quantity,
+            "price": price,
+            "total_amount": np.round(quantity * price, 2),
+            "order_date": now - days_ago,
+            "shipping_country": rng.choice(SHIPPING_COUNTRIES, size),
+            "payment_method": rng.choice(PAYMENT_METHODS, size),
+            "is_returned": rng.random(size) < 0.05,  # 5% return rate
+        }
+
     def generate_batch(self, size: int = BATCH_SIZE) -> list[Order]:
         """Generate a batch of order records.
 
@@ -64,7 +111,28 @@ class OrderGenerator:
         Returns:
             List of Order instances
         """
-        return [self.generate_single() for _ in range(size)]
+        columns = [
+            column.tolist() if isinstance(column, np.ndarray) else column
+            for column in self._generate_columns(size).values()
+        ]
+        return list(map(Order, *columns))
+
+    def generate_batch_arrow(self, size: int = BATCH_SIZE) -> pa.RecordBatch:
+        """Generate a batch of order records as an Arrow record batch.
+
+        Columns are built directly from the generated arrays, without
+        creating Order objects.
+
+        Args:
+            size: Number of orders to generate in this batch
+
+        Returns:
+            Record batch with one column per Order field
+        """
+        columns = self._generate_columns(size)
+        return pa.record_batch(
+            [pa.array(column) for column in columns.values()], names=list(columns)
+        )
 
     def generate_stream(self, total_records: int) -> Iterator[list[Order]]:
         """Generate orders in batches as a stream.
@@ -81,6 +149,52 @@ class OrderGenerator:
             yield self.generate_batch(batch_size)
             remaining -= batch_size
 
+    def generate_stream_arrow(self, total_records: int) -> Iterator[pa.RecordBatch]:
+        """Generate orders in Arrow record batches as a stream.
+
+        Args:
+            total_records: Total number of records to generate
+
+        Yields:
+            Record batches of orders
+        """
+        remaining = total_records
+        while remaining > 0:
+            batch_size = min(BATCH_SIZE, remaining)
+            yield self.generate_batch_arrow(batch_size)
+            remaining -= batch_size
+
+    def generate_stream_parallel(
+        self, total_records: int, max_workers: int | None = None
+    ) -> Iterator[list[Order]]:
+        """Generate orders in batches using a pool of worker processes.
+
+        Every batch is generated by a fresh generator seeded from
+        (seed, batch index), so for a given seed the output is the same
+        regardless of the number of workers, apart from order dates, which
+        are relative to the current time. It differs from what
+        generate_stream() yields for the same seed. Without a seed a random
+        base seed is drawn for the call, since forked workers inherit the
+        parent's random and Faker state and would repeat each other's
+        batches. Batches are yielded in order.
+
+        Args:
+            total_records: Total number of records to generate
+            max_workers: Number of worker processes (default: CPU count)
+
+        Yields:
+            Batches of Order instances
+        """
+        batch_sizes = [
+            min(BATCH_SIZE, total_records - start)
+            for start in range(0, total_records, BATCH_SIZE)
+        ]
+        base_seed = secrets.randbits(64) if self.seed is None else self.seed
+        seeds = [base_seed * 2**32 + index for index in range(len(batch_sizes))]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(_generate_seeded_batch, batch_sizes, seeds)
+
     def estimate_records_for_size(self, target_size_gb: float) -> int:
         """Estimate number of records needed to reach target size.
 
@@ -95,3 +209,43 @@ class OrderGenerator:
         avg_record_size_bytes = 200
         target_size_bytes = target_size_gb * 1024 * 1024 * 1024
         return int(target_size_bytes / avg_record_size_bytes)
+
+
+def _generate_seeded_batch(size: int, seed: int) -> list[Order]:
+    """Process pool entry point: generate one batch with its own seed.
+
+    Args:
+        size: Number of orders to generate
+        seed: Random seed for this batch
+
+    Returns:
+        List of Order instances
+    """
+    return OrderGenerator(seed=seed).generate_batch(size)
+
+
+def _random_uuid4_strings(rng: np.random.Generator, size: int) -> np.ndarray:
+    """Generate random version 4 UUID strings in bulk.
+
+    Same format as str(uuid.uuid4()), but the random bytes for the whole
+    batch come from a single rng.bytes() call, so seeded generators produce
+    the same ids, and the hex formatting is vectorized.
+
+    Args:
+        rng: NumPy generator to draw the random bytes from
+        size: Number of UUIDs to generate
+
+    Returns:
+        Array of 36-character UUID strings
+    """
+    raw = np.frombuffer(rng.bytes(16 * size), dtype=np.uint8).reshape(size, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # Version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+
+    nibbles = np.empty((size, 32), dtype=np.uint8)
+    nibbles[:, 0::2] = raw >> 4
+    nibbles[:, 1::2] = raw & 0x0F
+
+    chars = np.full((size, 36), ord("-"), dtype=np.uint8)
+    chars[:, _UUID_HEX_OFFSETS] = _HEX_DIGITS[nibbles]
+    return chars.view("S36").ravel().astype("U36")
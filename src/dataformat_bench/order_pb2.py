@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: order.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'order.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0border.proto\x12\x10\x64\x61taformat_bench\"\xfc\x01\n\x05Order\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63ustomer_id\x18\x02 \x01(\x03\x12\x12\n\nproduct_id\x18\x03 \x01(\x03\x12\x14\n\x0cproduct_name\x18\x04 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x05 \x01(\t\x12\x10\n\x08quantity\x18\x06 \x01(\x05\x12\r\n\x05price\x18\x07 \x01(\x01\x12\x14\n\x0ctotal_amount\x18\x08 \x01(\x01\x12\x12\n\norder_date\x18\t \x01(\x03\x12\x18\n\x10shipping_country\x18\n \x01(\t\x12\x16\n\x0epayment_method\x18\x0b \x01(\t\x12\x13\n\x0bis_returned\x18\x0c \x01(\x08\"5\n\nOrderBatch\x12\'\n\x06orders\x18\x01 \x03(\x0b\x32\x17.dataformat_bench.Orderb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'order_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_ORDER']._serialized_start=34
+  _globals['_ORDER']._serialized_end=286
+  _globals['_ORDERBATCH']._serialized_start=288
+  _globals['_ORDERBATCH']._serialized_end=341
+# @@protoc_insertion_point(module_scope)
@@ -2,20 +2,17 @@
 
 import json
 import os
-import signal
 import time
-from dataclasses import asdict, dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from .config import BENCHMARK_RUNS, DATA_DIR
-from .formats.base import FormatHandler
-
+import orjson
 
-class TimeoutError(Exception):
-    """Raised when operation exceeds timeout."""
-
-    pass
+from .config import BENCHMARK_RUNS, DATA_DIR
+from .formats.base import FormatHandler, TimeoutError
+from .fsutil import drop_file_cache
 
 
 @dataclass
@@ -42,6 +39,7 @@ class ReadBenchmark:
         runs: int = BENCHMARK_RUNS,
         filter_category: str = "Electronics",
         timeout_seconds: int = 600,  # 10 minutes default
+        parallel_read: bool = False,
     ):
         """Initialize read benchmark.
 
@@ -50,55 +48,50 @@ class ReadBenchmark:
             runs: Number of times to repeat each test
             filter_category: Category for filtered read tests
             timeout_seconds: Timeout for each operation in seconds (default: 600 = 10min)
+            parallel_read: Benchmark formats concurrently, one process each.
+                The formats then compete for CPU and disk, so their timings
+                are not comparable with each other or with serial runs.
         """
         self.input_dir = input_dir
         self.runs = runs
         self.filter_category = filter_category
         self.timeout_seconds = timeout_seconds
-
-    def _timeout_handler(self, signum, frame):
-        """Signal handler for timeout."""
-        raise TimeoutError("Operation timed out")
+        self.parallel_read = parallel_read
 
     def _time_operation_with_timeout(
         self, operation, timeout: int
     ) -> tuple[float | None, any, bool]:
         """Time an operation with timeout.
 
+        The operation runs on the calling thread and receives a
+        time.monotonic() deadline; handlers check it between batches and
+        raise TimeoutError once it has passed. No signals or helper threads
+        are involved, so this works on any thread and on any platform.
+
         Args:
-            operation: Callable to time
+            operation: Callable taking the deadline and returning the result
             timeout: Timeout in seconds
 
         Returns:
             Tuple of (duration in seconds or None, result or None, timed_out flag)
         """
-        # Set up signal handler for timeout
-        old_handler = signal.signal(signal.SIGALRM, self._timeout_handler)
-        signal.alarm(timeout)
-
+        deadline = time.monotonic() + timeout
         start_time = time.perf_counter()
-        timed_out = False
-        result = None
 
         try:
-            result = operation()
-            duration = time.perf_counter() - start_time
+            result = operation(deadline)
         except TimeoutError:
-            duration = None
-            timed_out = True
-        finally:
-            # Cancel alarm and restore old handler
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
+            return None, None, True
 
-        return duration, result, timed_out
+        return time.perf_counter() - start_time, result, False
 
-    def _clear_cache(self):
-        """Attempt to clear filesystem cache."""
-        try:
-            os.sync()
-        except (AttributeError, OSError):
-            pass
+    def _clear_cache(self, file_path: Path):
+        """Evict the benchmark file from the filesystem cache (best effort).
+
+        Args:
+            file_path: File about to be read
+        """
+        drop_file_cache(file_path)
 
     def run_single_format(
         self,
@@ -134,16 +127,11 @@ class ReadBenchmark:
         full_scan_timeout = False
 
         for run in range(self.runs):
-            self._clear_cache()
-
-            def full_scan():
-                count = 0
-                for _ in handler.read_full(file_path):
-                    count += 1
-                return count
+            self._clear_cache(file_path)
 
             duration, count, timed_out = self._time_operation_with_timeout(
-                full_scan, self.timeout_seconds
+                lambda deadline: handler.count_full(file_path, deadline),
+                self.timeout_seconds,
             )
 
             if timed_out:
@@ -167,16 +155,13 @@ class ReadBenchmark:
         filtered_read_timeout = False
 
         for run in range(self.runs):
-            self._clear_cache()
-
-            def filtered_scan():
-                count = 0
-                for _ in handler.read_filtered(file_path, self.filter_category):
-                    count += 1
-                return count
+            self._clear_cache(file_path)
 
             duration, filtered_count, timed_out = self._time_operation_with_timeout(
-                filtered_scan, self.timeout_seconds
+                lambda deadline: handler.count_filtered(
+                    file_path, self.filter_category, deadline
+                ),
+                self.timeout_seconds,
             )
 
             if timed_out:
@@ -201,10 +186,11 @@ class ReadBenchmark:
         aggregate_timeout = False
 
         for run in range(self.runs):
-            self._clear_cache()
+            self._clear_cache(file_path)
 
             duration, result, timed_out = self._time_operation_with_timeout(
-                lambda: handler.aggregate(file_path), self.timeout_seconds
+                lambda deadline: handler.aggregate(file_path, deadline),
+                self.timeout_seconds,
             )
 
             if timed_out:
@@ -256,6 +242,10 @@ class ReadBenchmark:
     ) -> list[ReadResult]:
         """Run read benchmark for all formats.
 
+        Formats are benchmarked one after another, so each measurement has
+        the machine to itself. With parallel_read they run in one worker
+        process per format instead. Results are returned in handler order.
+
         Args:
             handlers: List of format handlers
 
@@ -267,12 +257,15 @@ class ReadBenchmark:
         print(f"Runs per test: {self.runs}")
         print(f"Filter category: {self.filter_category}")
 
-        results = []
-        for handler in handlers:
-            result = self.run_single_format(handler)
-            results.append(result)
+        if not self.parallel_read:
+            return [self.run_single_format(handler) for handler in handlers]
 
-        return results
+        max_workers = min(len(handlers), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.run_single_format, handler) for handler in handlers
+            ]
+            return [future.result() for future in futures]
 
     def save_results(self, results: list[ReadResult], output_path: Path):
         """Save read results to JSON.
@@ -281,9 +274,9 @@ class ReadBenchmark:
             results: List of read results
             output_path: Path to output JSON file
         """
-        data = [asdict(r) for r in results]
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # orjson serializes dataclass instances natively
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         print(f"\n💾 Read results saved to: {output_path}")
 
     @staticmethod
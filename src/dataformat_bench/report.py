@@ -1,11 +1,69 @@
 """Report generation for benchmark results."""
 
+import io
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from operator import attrgetter, le
 from pathlib import Path
-
-from tabulate import tabulate
+from typing import Callable, TextIO
 
 from .benchmark import BenchmarkResult
 
+# Metric positions in _ReportData.raw tuples and formatted rows; position 0
+# holds the format name
+SIZE, WRITE, READ_FULL, READ_FILTERED, AGGREGATE = range(1, 6)
+
+
+@dataclass(slots=True)
+class _ReportData:
+    """Result metrics collected once and shared by all report sections."""
+
+    # (format_name, size, write, read_full, read_filtered, aggregate) per result
+    raw: list[tuple]
+    # Summary table row per result: upper-case name and formatted metrics
+    formatted: list[list[str]]
+    # Best (minimum) value per metric, None if every result timed out;
+    # indexed by metric position minus one
+    best: list[float | None]
+
+
+@lru_cache(maxsize=1024)
+def _format_size(bytes_value: int) -> str:
+    """Format file size in human-readable form.
+
+    Args:
+        bytes_value: Size in bytes
+
+    Returns:
+        Formatted string (e.g., "2.5 GB")
+    """
+    # The bit length picks the unit without dividing: n >= 2**30 exactly
+    # when n.bit_length() > 30
+    magnitude = bytes_value.bit_length()
+    if magnitude > 30:
+        return f"{bytes_value / 1024**3:.2f} GB"
+    if magnitude > 20:
+        return f"{bytes_value / 1024**2:.2f} MB"
+    return f"{bytes_value / 1024:.2f} KB"
+
+
+@lru_cache(maxsize=1024)
+def _format_time(seconds: float | None) -> str:
+    """Format time in human-readable form.
+
+    Args:
+        seconds: Time in seconds or None if timed out
+
+    Returns:
+        Formatted string
+    """
+    if seconds is None:
+        return "TIMEOUT"
+    if seconds >= 60:
+        minutes = seconds / 60
+        return f"{minutes:.2f} min"
+    return f"{seconds:.2f} s"
+
 
 class ReportGenerator:
     """Generate formatted reports from benchmark results."""
@@ -16,59 +74,139 @@ class ReportGenerator:
         Args:
             results: List of benchmark results
         """
-        self.results = sorted(results, key=lambda r: r.format_name)
+        format_name = attrgetter("format_name")
+        names = list(map(format_name, results))
+        if all(map(le, names, names[1:])):
+            # Already in format order: keep the list instead of a sorted copy
+            self.results = results
+        else:
+            self.results = sorted(results, key=format_name)
+
+    @staticmethod
+    def _percentage_formatter(baseline: float | None) -> Callable[[float | None], str]:
+        """Build a formatter of percentage difference from a fixed baseline.
 
-    def _format_size(self, bytes_value: int) -> str:
-        """Format file size in human-readable form.
+        The baseline is checked once per column instead of once per cell.
 
         Args:
-            bytes_value: Size in bytes
+            baseline: Baseline value or None if timed out
 
         Returns:
-            Formatted string (e.g., "2.5 GB")
+            Function formatting a value (None if timed out) as a percentage
+            string with sign
         """
-        gb = bytes_value / (1024**3)
-        if gb >= 1:
-            return f"{gb:.2f} GB"
-        mb = bytes_value / (1024**2)
-        if mb >= 1:
-            return f"{mb:.2f} MB"
-        kb = bytes_value / 1024
-        return f"{kb:.2f} KB"
-
-    def _format_time(self, seconds: float | None) -> str:
-        """Format time in human-readable form.
+        if baseline is None or baseline == 0:
+
+            def format_percentage(value: float | None) -> str:
+                return "TIMEOUT" if value is None else "N/A"
+
+        else:
+
+            def format_percentage(value: float | None) -> str:
+                if value is None:
+                    return "TIMEOUT"
+                diff_pct = ((value - baseline) / baseline) * 100
+                return f"+{diff_pct:.1f}%" if diff_pct > 0 else f"{diff_pct:.1f}%"
+
+        return format_percentage
+
+    @staticmethod
+    def _render_github_table(headers: list[str], rows: list[list[str]]) -> str:
+        """Render a GitHub-flavored Markdown table with left-aligned columns.
 
         Args:
-            seconds: Time in seconds or None if timed out
+            headers: Column headers
+            rows: Table rows, one string per cell
 
         Returns:
-            Formatted string
+            Formatted table as string
         """
-        if seconds is None:
-            return "TIMEOUT"
-        if seconds >= 60:
-            minutes = seconds / 60
-            return f"{minutes:.2f} min"
-        return f"{seconds:.2f} s"
+        # As in tabulate's "github" format: each column is as wide as its
+        # longest cell, but at least two wider than its header
+        widths = [
+            max([len(header) + 2, *map(len, cells)])
+            for header, *cells in zip(headers, *rows)
+        ]
+
+        def render_row(cells: list[str]) -> str:
+            padded = [f"{cell:<{width}}" for cell, width in zip(cells, widths)]
+            return "| " + " | ".join(padded) + " |"
+
+        lines = [
+            render_row(headers),
+            "|" + "|".join("-" * (width + 2) for width in widths) + "|",
+        ]
+        lines.extend(render_row(row) for row in rows)
+        return "\n".join(lines)
+
+    @cached_property
+    def _data(self) -> _ReportData:
+        """Collect and format every result's metrics in a single pass.
+
+        Computed once: results are fixed after __init__.
+
+        Returns:
+            Precomputed report data
+        """
+        raw = []
+        formatted = []
+        best = [None] * AGGREGATE
+
+        for result in self.results:
+            values = (
+                result.file_size_bytes,
+                result.write_time_seconds,
+                result.read_full_time_seconds,
+                result.read_filtered_time_seconds,
+                result.aggregate_time_seconds,
+            )
+            raw.append((result.format_name, *values))
+            formatted.append(
+                [
+                    result.format_name.upper(),
+                    _format_size(values[0]),
+                    *map(_format_time, values[1:]),
+                ]
+            )
+
+            # Running minimum per metric, skipping timeouts
+            for i, value in enumerate(values):
+                if value is not None and (best[i] is None or value < best[i]):
+                    best[i] = value
+
+        return _ReportData(raw=raw, formatted=formatted, best=best)
 
-    def _calculate_percentage(self, value: float | None, baseline: float | None) -> str:
-        """Calculate percentage difference from baseline.
+    @staticmethod
+    def _best_and_worst(raw: list[tuple], metric: int) -> tuple[int | None, int | None]:
+        """Find the rows with the smallest and largest value of a metric.
+
+        Timed out (None) values are skipped; ties go to the earlier row.
 
         Args:
-            value: Current value or None if timed out
-            baseline: Baseline value or None if timed out
+            raw: Raw metric tuples
+            metric: Metric position
 
         Returns:
-            Formatted percentage string with sign
+            Tuple of (best row index, worst row index), None if no row has a value
         """
-        if value is None:
-            return "TIMEOUT"
-        if baseline is None or baseline == 0:
-            return "N/A"
-        diff_pct = ((value - baseline) / baseline) * 100
-        sign = "+" if diff_pct > 0 else ""
-        return f"{sign}{diff_pct:.1f}%"
+        best = worst = None
+        best_value = worst_value = 0
+
+        for i, row in enumerate(raw):
+            value = row[metric]
+            if value is None:
+                continue
+            if best is None:
+                best = worst = i
+                best_value = worst_value = value
+            elif value < best_value:
+                best = i
+                best_value = value
+            elif value > worst_value:
+                worst = i
+                worst_value = value
+
+        return best, worst
 
     def generate_summary_table(self) -> str:
         """Generate summary comparison table.
@@ -85,19 +223,7 @@ class ReportGenerator:
             "Aggregation",
         ]
 
-        rows = []
-        for result in self.results:
-            row = [
-                result.format_name.upper(),
-                self._format_size(result.file_size_bytes),
-                self._format_time(result.write_time_seconds),
-                self._format_time(result.read_full_time_seconds),
-                self._format_time(result.read_filtered_time_seconds),
-                self._format_time(result.aggregate_time_seconds),
-            ]
-            rows.append(row)
-
-        return tabulate(rows, headers=headers, tablefmt="github")
+        return self._render_github_table(headers, self._data.formatted)
 
     def generate_comparison_table(self) -> str:
         """Generate detailed comparison table with percentages.
@@ -108,20 +234,6 @@ class ReportGenerator:
         if not self.results:
             return "No results to compare"
 
-        # Find best (minimum) for each metric, filtering out None values
-        best_size = min(r.file_size_bytes for r in self.results)
-        best_write = min(r.write_time_seconds for r in self.results)
-        
-        # For read operations, filter out None (timeout) values
-        valid_read_full = [r.read_full_time_seconds for r in self.results if r.read_full_time_seconds is not None]
-        best_read_full = min(valid_read_full) if valid_read_full else None
-        
-        valid_read_filtered = [r.read_filtered_time_seconds for r in self.results if r.read_filtered_time_seconds is not None]
-        best_read_filtered = min(valid_read_filtered) if valid_read_filtered else None
-        
-        valid_aggregate = [r.aggregate_time_seconds for r in self.results if r.aggregate_time_seconds is not None]
-        best_aggregate = min(valid_aggregate) if valid_aggregate else None
-
         headers = [
             "Format",
             "Size vs Best",
@@ -131,21 +243,20 @@ class ReportGenerator:
             "Aggregate vs Best",
         ]
 
+        # One formatter per metric column, bound to that column's best value
+        formatters = [self._percentage_formatter(best) for best in self._data.best]
+
+        # Upper-case names are already computed for the summary rows
         rows = []
-        for result in self.results:
-            row = [
-                result.format_name.upper(),
-                self._calculate_percentage(result.file_size_bytes, best_size),
-                self._calculate_percentage(result.write_time_seconds, best_write),
-                self._calculate_percentage(result.read_full_time_seconds, best_read_full),
-                self._calculate_percentage(
-                    result.read_filtered_time_seconds, best_read_filtered
-                ),
-                self._calculate_percentage(result.aggregate_time_seconds, best_aggregate),
-            ]
+        for summary_row, (_, *values) in zip(self._data.formatted, self._data.raw):
+            row = [summary_row[0]]
+            row.extend(
+                format_percentage(value)
+                for format_percentage, value in zip(formatters, values)
+            )
             rows.append(row)
 
-        return tabulate(rows, headers=headers, tablefmt="github")
+        return self._render_github_table(headers, rows)
 
     def generate_analysis(self) -> str:
         """Generate analysis and conclusions.
@@ -156,99 +267,67 @@ class ReportGenerator:
         if not self.results:
             return "No results to analyze"
 
-        analysis = []
-        analysis.append("\n## Analysis\n")
+        raw = self._data.raw
+        formatted = self._data.formatted
 
         # File size analysis
-        sizes = {r.format_name: r.file_size_bytes for r in self.results}
-        best_size_format = min(sizes, key=sizes.get)
-        worst_size_format = max(sizes, key=sizes.get)
-
-        analysis.append("### File Size (Storage Efficiency)")
-        analysis.append(
-            f"- **Best:** {best_size_format.upper()} "
-            f"({self._format_size(sizes[best_size_format])})"
-        )
-        analysis.append(
-            f"- **Worst:** {worst_size_format.upper()} "
-            f"({self._format_size(sizes[worst_size_format])})"
-        )
-        compression_ratio = sizes[worst_size_format] / sizes[best_size_format]
-        analysis.append(
-            f"- {best_size_format.upper()} achieves {compression_ratio:.2f}x "
-            f"better compression than {worst_size_format.upper()}"
-        )
+        best_size, worst_size = self._best_and_worst(raw, SIZE)
+        best_name, best_size_text = formatted[best_size][0], formatted[best_size][SIZE]
+        worst_name = formatted[worst_size][0]
+        worst_size_text = formatted[worst_size][SIZE]
+        compression_ratio = raw[worst_size][SIZE] / raw[best_size][SIZE]
 
         # Write performance
-        write_times = {r.format_name: r.write_time_seconds for r in self.results}
-        best_write_format = min(write_times, key=write_times.get)
-
-        analysis.append("\n### Write Performance")
-        analysis.append(
-            f"- **Fastest:** {best_write_format.upper()} "
-            f"({self._format_time(write_times[best_write_format])})"
-        )
+        best_write = formatted[self._best_and_worst(raw, WRITE)[0]]
+
+        analysis = [
+            "\n## Analysis\n",
+            "### File Size (Storage Efficiency)",
+            f"- **Best:** {best_name} ({best_size_text})",
+            f"- **Worst:** {worst_name} ({worst_size_text})",
+            f"- {best_name} achieves {compression_ratio:.2f}x "
+            f"better compression than {worst_name}",
+            "\n### Write Performance",
+            f"- **Fastest:** {best_write[0]} ({best_write[WRITE]})",
+            "- Every format is timed writing the same Arrow record batches, "
+            "including its own conversion from columns; Avro and Protobuf "
+            "times are not comparable with reports where they wrote Order "
+            "objects",
+        ]
+        append = analysis.append
 
         # Read performance
-        read_times = {r.format_name: r.read_full_time_seconds for r in self.results if r.read_full_time_seconds is not None}
-        
-        analysis.append("\n### Full Scan Performance")
-        if read_times:
-            best_read_format = min(read_times, key=read_times.get)
-            analysis.append(
-                f"- **Fastest:** {best_read_format.upper()} "
-                f"({self._format_time(read_times[best_read_format])})"
-            )
-        else:
-            analysis.append("- All formats timed out during full scan")
-
-        # Filtered read performance
-        filtered_times = {r.format_name: r.read_filtered_time_seconds for r in self.results if r.read_filtered_time_seconds is not None}
-        
-        analysis.append("\n### Filtered Read Performance")
-        if filtered_times:
-            best_filtered_format = min(filtered_times, key=filtered_times.get)
-            analysis.append(
-                f"- **Fastest:** {best_filtered_format.upper()} "
-                f"({self._format_time(filtered_times[best_filtered_format])})"
-            )
-        else:
-            analysis.append("- All formats timed out during filtered reads")
-
-        # Aggregate performance
-        agg_times = {r.format_name: r.aggregate_time_seconds for r in self.results if r.aggregate_time_seconds is not None}
-        
-        analysis.append("\n### Aggregation Performance")
-        if agg_times:
-            best_agg_format = min(agg_times, key=agg_times.get)
-            analysis.append(
-                f"- **Fastest:** {best_agg_format.upper()} "
-                f"({self._format_time(agg_times[best_agg_format])})"
-            )
-        else:
-            analysis.append("- All formats timed out during aggregation")
+        sections = [
+            (READ_FULL, "Full Scan Performance", "full scan"),
+            (READ_FILTERED, "Filtered Read Performance", "filtered reads"),
+            (AGGREGATE, "Aggregation Performance", "aggregation"),
+        ]
+        for metric, title, operation in sections:
+            best, _ = self._best_and_worst(raw, metric)
+
+            append(f"\n### {title}")
+            if best is not None:
+                name, value = formatted[best][0], formatted[best][metric]
+                append(f"- **Fastest:** {name} ({value})")
+            else:
+                append(f"- All formats timed out during {operation}")
 
         # Check for predicate pushdown advantage
-        for result in self.results:
-            if result.format_name == "parquet":
-                if result.read_full_time_seconds is not None and result.read_filtered_time_seconds is not None:
-                    speedup = (
-                        result.read_full_time_seconds / result.read_filtered_time_seconds
-                    )
+        for row in raw:
+            if row[0] == "parquet":
+                if row[READ_FULL] is not None and row[READ_FILTERED] is not None:
+                    speedup = row[READ_FULL] / row[READ_FILTERED]
                     if speedup > 2:
-                        analysis.append(
+                        append(
                             f"- Parquet shows {speedup:.1f}x speedup with predicate pushdown"
                         )
 
         return "\n".join(analysis)
 
-    def generate_full_report(self) -> str:
-        """Generate complete report with all sections.
-
-        Returns:
-            Full report as formatted string
-        """
-        report_parts = [
+    @cached_property
+    def _report_parts(self) -> list[str]:
+        """Report sections in order, rendered once and shared by save and print."""
+        return [
             "# Data Format Benchmark Results",
             "",
             f"Total records: {self.results[0].record_count:,}",
@@ -264,7 +343,27 @@ class ReportGenerator:
             self.generate_analysis(),
         ]
 
-        return "\n".join(report_parts)
+    def write_report(self, f: TextIO):
+        """Write complete report section by section, one line apart.
+
+        Args:
+            f: Text file open for writing
+        """
+        write = f.write
+        for i, part in enumerate(self._report_parts):
+            if i:
+                write("\n")
+            write(part)
+
+    def generate_full_report(self) -> str:
+        """Generate complete report with all sections.
+
+        Returns:
+            Full report as formatted string
+        """
+        buffer = io.StringIO()
+        self.write_report(buffer)
+        return buffer.getvalue()
 
     def save_report(self, output_path: Path):
         """Save report to file.
@@ -272,9 +371,8 @@ class ReportGenerator:
         Args:
             output_path: Path to output file
         """
-        report = self.generate_full_report()
         with open(output_path, "w") as f:
-            f.write(report)
+            self.write_report(f)
         print(f"\n📄 Report saved to: {output_path}")
 
     def print_report(self):
@@ -1,11 +1,11 @@
 """Data schema definitions."""
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """E-commerce order data structure."""
 
@@ -21,20 +21,50 @@ class Order:
     shipping_country: str
     payment_method: str
     is_returned: bool
+    # order_date as Unix epoch milliseconds, the form every serializer uses;
+    # derived once at construction
+    order_date_ms: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.order_date_ms = int(self.order_date.timestamp() * 1000)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert order to dictionary with serializable types."""
-        data = asdict(self)
-        data["order_date"] = int(self.order_date.timestamp() * 1000)  # milliseconds
-        return data
+        return {
+            "order_id": self.order_id,
+            "customer_id": self.customer_id,
+            "product_id": self.product_id,
+            "product_name": self.product_name,
+            "category": self.category,
+            "quantity": self.quantity,
+            "price": self.price,
+            "total_amount": self.total_amount,
+            "order_date": self.order_date_ms,  # milliseconds
+            "shipping_country": self.shipping_country,
+            "payment_method": self.payment_method,
+            "is_returned": self.is_returned,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Order":
         """Create Order from dictionary."""
-        data = data.copy()
-        if isinstance(data["order_date"], int):
-            data["order_date"] = datetime.fromtimestamp(data["order_date"] / 1000)
-        return cls(**data)
+        order_date = data["order_date"]
+        if isinstance(order_date, int):
+            order_date = datetime.fromtimestamp(order_date / 1000)
+        return cls(
+            order_id=data["order_id"],
+            customer_id=data["customer_id"],
+            product_id=data["product_id"],
+            product_name=data["product_name"],
+            category=data["category"],
+            quantity=data["quantity"],
+            price=data["price"],
+            total_amount=data["total_amount"],
+            order_date=order_date,
+            shipping_country=data["shipping_country"],
+            payment_method=data["payment_method"],
+            is_returned=data["is_returned"],
+        )
 
     def to_avro_dict(self) -> dict[str, Any]:
         """Convert to Avro-compatible dictionary."""
@@ -47,7 +77,7 @@ class Order:
             "quantity": self.quantity,
             "price": self.price,
             "total_amount": self.total_amount,
-            "order_date": int(self.order_date.timestamp() * 1000),
+            "order_date": self.order_date_ms,
             "shipping_country": self.shipping_country,
             "payment_method": self.payment_method,
             "is_returned": self.is_returned,
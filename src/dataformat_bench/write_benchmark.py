@@ -1,17 +1,26 @@
 """Write benchmark - streaming data generation and writing."""
 
 import json
-import os
+import queue
+import sys
+import threading
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator, TypeVar
 
+import orjson
 from tqdm import tqdm
 
-from .config import DATA_DIR
+from .config import DATA_DIR, PREFETCH_BATCHES
 from .formats.base import FormatHandler
 from .generator import OrderGenerator
 
+T = TypeVar("T")
+
+# Marks the end of a prefetched stream
+_END = object()
+
 
 @dataclass
 class WriteResult:
@@ -27,13 +36,16 @@ class WriteResult:
 class WriteBenchmark:
     """Benchmark for streaming write operations."""
 
-    def __init__(self, output_dir: Path = DATA_DIR):
+    def __init__(self, output_dir: Path = DATA_DIR, parallel_generate: bool = False):
         """Initialize write benchmark.
 
         Args:
             output_dir: Directory for output files
+            parallel_generate: Generate batches on a background thread so
+                generation overlaps with writing
         """
         self.output_dir = output_dir
+        self.parallel_generate = parallel_generate
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def run_single_format(
@@ -64,28 +76,36 @@ class WriteBenchmark:
         if file_path.exists():
             file_path.unlink()
 
-        # Generate data stream
+        # Every format gets the same Arrow batches and converts them itself
         generator = OrderGenerator(seed=seed)
-        data_stream = generator.generate_stream(total_records)
+        data_stream = generator.generate_stream_arrow(total_records)
+
+        if self.parallel_generate:
+            data_stream = _prefetch(data_stream, PREFETCH_BATCHES)
 
         # Progress tracking
-        pbar = tqdm(total=total_records, desc=f"Writing {handler.format_name}")
+        pbar = tqdm(
+            total=total_records,
+            desc=f"Writing {handler.format_name}",
+            mininterval=1.0,
+            smoothing=0,
+            disable=not sys.stderr.isatty(),
+        )
 
         def progress_callback(count: int):
-            pbar.n = count
-            pbar.refresh()
+            # update() redraws at most once per mininterval, unlike refresh()
+            pbar.update(count - pbar.n)
 
         # Measure write time
-        start_time = time.perf_counter()
-        records_written = handler.write_streaming(
+        start_ns = time.perf_counter_ns()
+        records_written, file_size = handler.write_streaming_batches(
             data_stream, file_path, progress_callback
         )
-        end_time = time.perf_counter()
+        end_ns = time.perf_counter_ns()
 
         pbar.close()
 
-        write_time = end_time - start_time
-        file_size = os.path.getsize(file_path)
+        write_time = (end_ns - start_ns) / 1e9
 
         print(f"✓ Wrote {records_written:,} records in {write_time:.2f}s")
         print(f"✓ File size: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)")
@@ -120,6 +140,11 @@ class WriteBenchmark:
         print(f"Formats: {', '.join(h.format_name for h in handlers)}")
         if seed is not None:
             print(f"Seed: {seed}")
+        print("Input: Arrow record batches, converted by each format while timed")
+        print(
+            "⚠️  Avro and Protobuf times include building rows from the Arrow "
+            "columns; not comparable with runs that wrote Order objects"
+        )
 
         results = []
         for handler in handlers:
@@ -135,9 +160,9 @@ class WriteBenchmark:
             results: List of write results
             output_path: Path to output JSON file
         """
-        data = [asdict(r) for r in results]
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # orjson serializes dataclass instances natively
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         print(f"\n💾 Write results saved to: {output_path}")
 
     @staticmethod
@@ -153,3 +178,53 @@ class WriteBenchmark:
         with open(input_path, "r") as f:
             data = json.load(f)
         return [WriteResult(**item) for item in data]
+
+
+def _prefetch(stream: Iterator[T], maxsize: int) -> Iterator[T]:
+    """Iterate over a stream that is produced on a background thread.
+
+    Up to maxsize items are produced ahead of the consumer, so producing
+    the next item overlaps with consuming the current one whenever either
+    side releases the GIL (file I/O, Arrow, compression). An exception
+    raised by the producer is re-raised to the consumer.
+
+    Args:
+        stream: Iterator to produce from
+        maxsize: Maximum number of items produced ahead
+
+    Yields:
+        Items of stream, in order
+    """
+    items = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in stream:
+                items.put((item, None))
+                if stop.is_set():
+                    return
+        except Exception as e:
+            items.put((_END, e))
+        else:
+            items.put((_END, None))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item, error = items.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        # The consumer stopped early: unblock a producer waiting on a full queue
+        stop.set()
+        while producer.is_alive():
+            try:
+                items.get(timeout=0.1)
+            except queue.Empty:
+                pass
@@ -0,0 +1,38 @@
+"""Tests for the Avro format handler."""
+
+from dataformat_bench.formats.avro import AvroHandler
+from dataformat_bench.generator import OrderGenerator
+from dataformat_bench.schema import Order
+
+
+def test_write_streaming_round_trip(tmp_path):
+    generator = OrderGenerator(seed=42)
+    batches = [generator.generate_batch(500) for _ in range(3)]
+    orders = [order for batch in batches for order in batch]
+    path = tmp_path / "orders.avro"
+    handler = AvroHandler()
+
+    records_written, file_size = handler.write_streaming(iter(batches), path)
+
+    assert records_written == len(orders)
+    assert file_size == path.stat().st_size
+    assert list(handler.read_full(path)) == orders
+    assert handler.count_full(path) == len(orders)
+
+
+def test_write_streaming_batches_round_trip(tmp_path):
+    generator = OrderGenerator(seed=42)
+    batches = [generator.generate_batch_arrow(500) for _ in range(3)]
+    orders = [
+        Order(*row)
+        for batch in batches
+        for row in zip(*(column.to_pylist() for column in batch.columns))
+    ]
+    path = tmp_path / "orders.avro"
+    handler = AvroHandler()
+
+    records_written, file_size = handler.write_streaming_batches(iter(batches), path)
+
+    assert records_written == len(orders)
+    assert file_size == path.stat().st_size
+    assert list(handler.read_full(path)) == orders
@@ -0,0 +1,40 @@
+"""Tests for the order generator."""
+
+import uuid
+
+from dataformat_bench import generator
+from dataformat_bench.generator import OrderGenerator
+
+
+def test_seeded_generators_produce_same_order_ids():
+    first = OrderGenerator(seed=42).generate_batch(100)
+    second = OrderGenerator(seed=42).generate_batch(100)
+    other = OrderGenerator(seed=43).generate_batch(100)
+
+    order_ids = [order.order_id for order in first]
+    assert order_ids == [order.order_id for order in second]
+    assert order_ids != [order.order_id for order in other]
+    assert all(str(uuid.UUID(order_id)) == order_id for order_id in order_ids)
+    assert {uuid.UUID(order_id).version for order_id in order_ids} == {4}
+
+
+def test_unseeded_parallel_batches_differ(monkeypatch):
+    monkeypatch.setattr(generator, "BATCH_SIZE", 200)
+
+    batches = list(OrderGenerator().generate_stream_parallel(1_600, max_workers=2))
+
+    assert len(batches) == 8
+    names = {tuple(order.product_name for order in batch) for batch in batches}
+    order_ids = {order.order_id for batch in batches for order in batch}
+    assert len(names) == len(batches)
+    assert len(order_ids) == 1_600
+
+
+def test_seeded_parallel_batches_do_not_depend_on_workers(monkeypatch):
+    monkeypatch.setattr(generator, "BATCH_SIZE", 200)
+
+    def order_ids(max_workers):
+        stream = OrderGenerator(seed=7).generate_stream_parallel(800, max_workers)
+        return [order.order_id for batch in stream for order in batch]
+
+    assert order_ids(1) == order_ids(2)
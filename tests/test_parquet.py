@@ -0,0 +1,41 @@
+"""Tests for the Parquet format handler."""
+
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from dataformat_bench.formats.parquet import ParquetHandler
+from dataformat_bench.generator import OrderGenerator
+
+
+def test_read_filtered_prunes_row_groups(tmp_path):
+    generator = OrderGenerator(seed=42)
+    batches = [generator.generate_batch(500) for _ in range(40)]
+    path = tmp_path / "orders.parquet"
+    handler = ParquetHandler(row_group_size=1_000)
+
+    handler.write_streaming(iter(batches), path)
+
+    category = "Electronics"
+    expected = sorted(
+        (order for batch in batches for order in batch if order.category == category),
+        key=lambda order: order.order_id,
+    )
+    assert expected
+
+    # The scan skips row groups whose category statistics exclude the value
+    fragment = next(ds.dataset(path, format="parquet").get_fragments())
+    scanned = fragment.split_by_row_group(ds.field("category") == category)
+    num_row_groups = pq.ParquetFile(path).metadata.num_row_groups
+    assert num_row_groups == 20
+    assert 0 < len(scanned) <= num_row_groups // 2
+
+    orders = sorted(handler.read_filtered(path, category), key=lambda o: o.order_id)
+    assert orders == expected
+    assert handler.count_filtered(path, category) == len(expected)
+
+
+def test_sort_buffer_is_capped_to_whole_row_groups():
+    assert ParquetHandler(row_group_size=300_000).sort_buffer_rows == 900_000
+    assert ParquetHandler(row_group_size=2_000_000).sort_buffer_rows == 2_000_000
+    handler = ParquetHandler(row_group_size=1_000, sort_buffer_rows=2_500)
+    assert handler.sort_buffer_rows == 2_000
@@ -0,0 +1,50 @@
+"""Tests for read benchmark timeouts."""
+
+import time
+
+import pytest
+
+from dataformat_bench.formats import protobuf
+from dataformat_bench.formats.avro import AvroHandler
+from dataformat_bench.formats.base import TimeoutError
+from dataformat_bench.formats.parquet import ParquetHandler
+from dataformat_bench.formats.protobuf import ProtobufHandler
+from dataformat_bench.generator import OrderGenerator
+from dataformat_bench.read_benchmark import ReadBenchmark
+
+
+@pytest.mark.parametrize(
+    "handler", [ParquetHandler(), AvroHandler(), ProtobufHandler()]
+)
+def test_operations_stop_at_deadline(tmp_path, monkeypatch, handler):
+    # Protobuf checks every DEADLINE_CHECK_INTERVAL frames; make that all of them
+    monkeypatch.setattr(protobuf, "DEADLINE_CHECK_INTERVAL", 1)
+    generator = OrderGenerator(seed=42)
+    path = handler.get_file_path(tmp_path / "orders")
+    handler.write_streaming(iter([generator.generate_batch(500)]), path)
+
+    expired = time.monotonic() - 1
+    with pytest.raises(TimeoutError):
+        handler.count_full(path, expired)
+    with pytest.raises(TimeoutError):
+        handler.count_filtered(path, "Electronics", expired)
+    with pytest.raises(TimeoutError):
+        handler.aggregate(path, expired)
+
+    assert handler.count_full(path, time.monotonic() + 60) == 500
+
+
+def test_time_operation_reports_timeout():
+    benchmark = ReadBenchmark()
+
+    def operation(deadline):
+        raise TimeoutError("Operation timed out")
+
+    assert benchmark._time_operation_with_timeout(operation, 1) == (None, None, True)
+
+    duration, result, timed_out = benchmark._time_operation_with_timeout(
+        lambda deadline: deadline, 1
+    )
+    assert not timed_out
+    assert duration >= 0
+    assert result > time.monotonic()
@@ -0,0 +1,46 @@
+"""Tests for report generation."""
+
+from dataformat_bench.benchmark import BenchmarkResult
+from dataformat_bench.report import ReportGenerator
+
+# Rendered by tabulate 0.9.0 (tablefmt="github") from the same results
+TABULATE_SUMMARY = """\
+| Format   | File Size   | Write Time   | Full Scan   | Filtered Read   | Aggregation   |
+|----------|-------------|--------------|-------------|-----------------|---------------|
+| AVRO     | 5.02 GB     | 11.14 min    | 2.58 min    | 1.82 min        | 1.78 min      |
+| PARQUET  | 4.11 GB     | 7.90 min     | TIMEOUT     | 56.35 s         | 1.40 s        |
+| PROTOBUF | 7.35 GB     | 8.50 min     | 1.61 min    | 34.06 s         | 33.94 s       |"""
+
+TABULATE_COMPARISON = """\
+| Format   | Size vs Best   | Write vs Best   | Full Scan vs Best   | Filtered vs Best   | Aggregate vs Best   |
+|----------|----------------|-----------------|---------------------|--------------------|---------------------|
+| AVRO     | +22.1%         | +41.0%          | +60.2%              | +220.6%            | +7528.6%            |
+| PARQUET  | 0.0%           | 0.0%            | TIMEOUT             | +65.4%             | 0.0%                |
+| PROTOBUF | +78.8%         | +7.6%           | 0.0%                | 0.0%               | +2324.3%            |"""
+
+
+def test_tables_match_tabulate_github_format():
+    results = [
+        BenchmarkResult("avro", 5_390_000_000, 668.4, 154.8, 109.2, 106.8, 53_687_091),
+        BenchmarkResult("parquet", 4_413_000_000, 474.0, None, 56.35, 1.4, 53_687_091),
+        BenchmarkResult("protobuf", 7_892_000_000, 510.0, 96.6, 34.06, 33.94, 53_687_091),
+    ]
+    generator = ReportGenerator(results)
+
+    assert generator.generate_summary_table() == TABULATE_SUMMARY
+    assert generator.generate_comparison_table() == TABULATE_COMPARISON
+
+
+def test_render_github_table_pads_like_tabulate():
+    headers = ["Format", "File Size"]
+
+    assert ReportGenerator._render_github_table(headers, []) == (
+        "| Format   | File Size   |\n|----------|-------------|"
+    )
+    assert ReportGenerator._render_github_table(
+        headers, [["PROTOBUF-EXTENDED", "1 B"]]
+    ) == (
+        "| Format            | File Size   |\n"
+        "|-------------------|-------------|\n"
+        "| PROTOBUF-EXTENDED | 1 B         |"
+    )